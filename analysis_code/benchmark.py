@@ -0,0 +1,288 @@
+"""
+Benchmark suite for the graph script, on synthetic surveys of several sizes.
+
+    python benchmark.py [--scales 10,100,1000] [--only 5,13,37] [--chunksize N]
+                        [--out benchmark_report.json] [--baseline old_report.json]
+
+Each scale is a synthetic export of 659 x scale responses (synthetic_survey.py,
+written as Parquet to a scratch folder) run through the script's own stages
+and graphs - the `render --stream` path, so even 1000x never sits in memory
+as plain strings. Timed at every scale:
+
+    ingestion, screening,       one chunked pass over the export: reading the
+    condition_detection         chunks, screen_responses(), CONDITION_MATCHER
+    stages                      each @stage (load_screened_survey,
+                                respondent_features, regression_dataset, ...)
+    graphs                      each @graph: 'aggregation' is everything but
+                                savefig (aggregating + drawing), 'savefig' the
+                                final draw for the PNG, 'encode' the PNG
+                                encode/write (image_writer, off the render
+                                thread), plus the PNG size
+    model_fits                  every statsmodels OLS .fit() and every
+                                GramAccumulator.fit() (Models 1-3, solved from
+                                the Gram matrices - gram_ols.py), where it ran
+
+Once per report: the cost of resolving the graphs' font (fonts.py) - cold,
+and again from its cache - and which font file it came out as.
+
+The report is JSON with a fixed key order and rounded times, one entry per
+scale, written after every scale - two reports from different versions diff
+line by line, and --baseline prints the per-item ratios against an old one.
+Graph PNGs go to the scratch folder, never to graphs_v3/graphs_v4.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import synthetic_survey
+
+REPORT_NAME = 'benchmark_report.json'
+DEFAULT_SCALES = (10, 100, 1000)
+
+
+def _seconds(x):
+    return round(x, 4)
+
+
+class Probe:
+    """Times the plt.savefig, OLS.fit and GramAccumulator.fit calls made while it is installed, per `where`."""
+
+    def __init__(self):
+        self.where = None
+        self.savefig = {}  # where -> seconds
+        self.fits = []     # {'where', 'method', 'nobs', 'params', 'seconds'} per fit
+
+    @contextlib.contextmanager
+    def installed(self):
+        import matplotlib.pyplot as plt
+        from statsmodels.regression.linear_model import OLS
+
+        from gram_ols import GramAccumulator
+
+        savefig, fit, gram_fit = plt.savefig, OLS.fit, GramAccumulator.fit
+
+        def timed_savefig(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return savefig(*args, **kwargs)
+            finally:
+                self.savefig[self.where] = self.savefig.get(self.where, 0.0) + time.perf_counter() - start
+
+        def timed_fit(model, *args, **kwargs):
+            start = time.perf_counter()
+            result = fit(model, *args, **kwargs)
+            self.fits.append({'where': self.where, 'method': 'OLS', 'nobs': int(model.nobs),
+                              'params': int(model.exog.shape[1]), 'seconds': _seconds(time.perf_counter() - start)})
+            return result
+
+        def timed_gram_fit(gram, predictors):
+            start = time.perf_counter()
+            result = gram_fit(gram, predictors)
+            self.fits.append({'where': self.where, 'method': 'Gram', 'nobs': int(result.nobs),
+                              'params': len(result.exog_names), 'seconds': _seconds(time.perf_counter() - start)})
+            return result
+
+        plt.savefig, OLS.fit, GramAccumulator.fit = timed_savefig, timed_fit, timed_gram_fit
+        try:
+            yield self
+        finally:
+            plt.savefig, OLS.fit, GramAccumulator.fit = savefig, fit, gram_fit
+
+
+def quietly(func, *args):
+    """(func(*args), seconds) with the script's log output swallowed."""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def time_input_passes(script, source):
+    """Seconds spent reading the chunks, screening them and detecting conditions, in one pass."""
+    from features import lower_text
+    from survey_stream import iter_chunks
+
+    totals = {'ingestion': 0.0, 'screening': 0.0, 'condition_detection': 0.0}
+    chunks = iter_chunks(source.path, source.chunksize)
+    while True:
+        start = time.perf_counter()
+        chunk = next(chunks, None)
+        totals['ingestion'] += time.perf_counter() - start
+        if chunk is None:
+            break
+        _, seconds = quietly(script.screen_responses, chunk)
+        totals['screening'] += seconds
+        start = time.perf_counter()
+        text = lower_text(chunk.iloc[:, 28]) + ' ' + lower_text(chunk.iloc[:, 8])
+        script.CONDITION_MATCHER.contains(text)
+        totals['condition_detection'] += time.perf_counter() - start
+    return {name: _seconds(s) for name, s in totals.items()}
+
+
+def time_font_resolution():
+    """{'family', 'path', 'cold_s', 'cached_us'} for fonts.resolve()."""
+    import fonts
+
+    fonts.resolve.cache_clear()
+    fonts.font_properties.cache_clear()
+    start = time.perf_counter()
+    family, path = fonts.resolve()
+    cold = time.perf_counter() - start
+    start = time.perf_counter()
+    fonts.resolve()
+    cached = time.perf_counter() - start
+    return {'family': family, 'path': path, 'cold_s': _seconds(cold), 'cached_us': round(cached * 1e6, 2)}
+
+
+def run_scale(script, scale, keys, chunksize, workdir, seed=0):
+    """One benchmark entry: generate the export, then time input passes, stages and graphs."""
+    import matplotlib.pyplot as plt
+
+    import image_writer
+    from pipeline import GRAPHS, STAGES, resolve, stages_for
+    from survey_stream import SurveySource
+
+    rows = synthetic_survey.REAL_ROWS * scale
+    export = workdir / f'synthetic_x{scale}.parquet'
+    start = time.perf_counter()
+    synthetic_survey.write_export(export, rows, seed)
+    entry = {'scale': scale, 'rows': rows, 'generate': _seconds(time.perf_counter() - start),
+             'export_bytes': export.stat().st_size}
+
+    text_columns = sorted({pos for key in keys for pos in script.TEXT_GRAPH_COLUMNS.get(key, [])})
+    source = SurveySource(str(export), chunksize, text_columns)
+    entry.update(time_input_passes(script, source))
+
+    probe = Probe()
+    data = {'survey_source': source}
+    by_name = {s.func.__name__: s for s in STAGES.values()}
+    entry['stages'] = {}
+    entry['graphs'] = {}
+    with probe.installed():
+        for name in stages_for(keys):
+            s = by_name[name]
+            if all(p in data for p in s.provides):
+                continue
+            probe.where = name
+            _, seconds = quietly(resolve, s.provides, data)
+            entry['stages'][name] = _seconds(seconds)
+        entry['rows_screened'] = len(data['raw_df'])
+
+        for key in keys:
+            g = GRAPHS[key]
+            probe.where = f'graph {key}'
+            result = {}
+            try:
+                _, seconds = quietly(g.func, *(data[n] for n in g.needs))
+            except Exception as e:  # A graph that can't handle the synthetic data shouldn't stop the rest
+                seconds = 0.0
+                result['error'] = f'{type(e).__name__}: {e}'
+            finally:
+                plt.close('all')
+                written = image_writer.drain()
+            saving = probe.savefig.get(probe.where, 0.0)
+            result.update({'seconds': _seconds(seconds), 'aggregation': _seconds(max(seconds - saving, 0.0)),
+                           'savefig': _seconds(saving), 'encode': _seconds(sum(w['encode_s'] for w in written)),
+                           'png_bytes': sum(os.path.getsize(p) for p in g.outputs if os.path.exists(p))})
+            entry['graphs'][key] = result
+    entry['model_fits'] = probe.fits
+    export.unlink()
+    return entry
+
+
+def environment():
+    import matplotlib
+    import numpy
+    import pandas
+    import statsmodels
+
+    return {'python': platform.python_version(), 'platform': platform.platform(), 'cpus': os.cpu_count(),
+            'numpy': numpy.__version__, 'pandas': pandas.__version__,
+            'matplotlib': matplotlib.__version__, 'statsmodels': statsmodels.__version__}
+
+
+def flatten(entry):
+    """{'stage load_screened_survey': seconds, 'graph 5': seconds, ...} for one scale."""
+    flat = {name: entry[name] for name in ('generate', 'ingestion', 'screening', 'condition_detection')}
+    flat.update({f'stage {name}': s for name, s in entry['stages'].items()})
+    flat.update({f'graph {key}': g['seconds'] for key, g in entry['graphs'].items()})
+    return flat
+
+
+def print_summary(report, baseline=None):
+    old = {e['scale']: flatten(e) for e in baseline['runs']} if baseline else {}
+    font = report['font_resolution']
+    print(f"\nFont: {font['family']} ({font['path']}) - resolved in {font['cold_s']:.4f} s, "
+          f"{font['cached_us']:.2f} µs from the cache")
+    for entry in report['runs']:
+        before = old.get(entry['scale'], {})
+        print(f"\n{entry['scale']}x ({entry['rows']:,} rows, {entry['rows_screened']:,} after screening)")
+        print(f"  {'item':<36}{'seconds':>10}{'savefig':>10}{'encode':>10}"
+              + (f"{'baseline':>10}{'ratio':>8}" if before else ''))
+        for name, seconds in flatten(entry).items():
+            g = entry['graphs'].get(name[len('graph '):]) if name.startswith('graph ') else None
+            line = f"  {name:<36}{seconds:>10.3f}" + (f"{g['savefig']:>10.3f}{g.get('encode', 0):>10.3f}"
+                                                      if g else ' ' * 20)
+            if name in before:
+                ratio = seconds / before[name] if before[name] else float('nan')
+                line += f"{before[name]:>10.3f}{ratio:>7.2f}x"
+            print(line)
+        for fit in entry['model_fits']:
+            print(f"  {fit['method']} fit in {fit['where']}: n = {fit['nobs']:,}, {fit['params']} params, "
+                  f"{fit['seconds']:.4f} s")
+        for key, g in entry['graphs'].items():
+            if 'error' in g:
+                print(f"  ! graph {key} failed: {g['error']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Time the graph script on synthetic surveys.')
+    parser.add_argument('--scales', default=','.join(map(str, DEFAULT_SCALES)),
+                        help='comma-separated multiples of the real 659 rows (default: 10,100,1000)')
+    parser.add_argument('--only', metavar='KEYS', help='comma-separated graph keys (default: all)')
+    parser.add_argument('--chunksize', type=int, default=None,
+                        help='rows per streamed chunk (default: the script\'s DEFAULT_CHUNKSIZE)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', default=REPORT_NAME)
+    parser.add_argument('--baseline', metavar='REPORT', help='an earlier report to compare against')
+    args = parser.parse_args(argv)
+
+    import all_pretty_graphs_v3 as script
+    from pipeline import select
+
+    keys = select(args.only.split(',') if args.only else None)
+    scales = [int(s) for s in args.scales.split(',') if s.strip()]
+    chunksize = args.chunksize or script.DEFAULT_CHUNKSIZE
+    baseline = json.loads(Path(args.baseline).read_text()) if args.baseline else None
+    font_resolution = time_font_resolution()
+    script.apply_pretty_style()
+
+    report = {'environment': environment(), 'font_resolution': font_resolution,
+              'seed': args.seed, 'chunksize': chunksize, 'runs': []}
+    cwd = os.getcwd()
+    out = Path(args.out).resolve()
+    with tempfile.TemporaryDirectory(prefix='survey-benchmark-') as tmp:
+        workdir = Path(tmp)
+        (workdir / 'graphs_v3').mkdir()
+        (workdir / 'graphs_v4').mkdir()
+        os.chdir(workdir)
+        try:
+            for scale in scales:
+                print(f"Benchmarking {scale}x ({synthetic_survey.REAL_ROWS * scale:,} rows)...", flush=True)
+                report['runs'].append(run_scale(script, scale, keys, chunksize, workdir, args.seed))
+                out.write_text(json.dumps(report, indent=2, ensure_ascii=False) + '\n')
+        finally:
+            os.chdir(cwd)
+    print_summary(report, baseline)
+    print(f"\nReport: {out}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,161 @@
+"""
+Batched bootstrap for the REGRESSION CITY models (percentile + BCa intervals).
+
+Refitting statsmodels OLS 10,000 times is slow. A bootstrap replicate of OLS
+only needs X'WX, X'Wy, y'Wy and the sum of y (W = how often each row was drawn),
+and each of those is linear in the per-row terms. So the whole bootstrap is:
+
+    idx     = rng.integers(0, n, (B, n))       # all resample indices, one matrix
+    W       = per-replicate draw counts        # (B, n), via one bincount
+    X'WX    = W @ (x_i x_i')                   # (B, k, k) - one matmul
+    beta    = solve(X'WX, X'Wy)                # batched normal equations
+    R^2     = 1 - SSR / SST                    # from the same moments
+
+The jackknife that BCa needs is the same thing with W = 1 - I (leave one out),
+i.e. the full-sample moments minus each row's own terms.
+All three models x 10,000 replicates take a fraction of a second. Replicates
+are drawn in blocks through resample_pool, so a run with several workers gives
+the same intervals as a serial one.
+"""
+import numpy as np
+
+from resample_pool import bounded_block, run_blocks
+
+N_BOOT = 10_000
+BOOTSTRAP_SEED = 20250807  # Fixed, so the intervals in the log don't move between runs
+BATCH = 2_000  # Replicates per block/matmul (bounds the (B, n) count matrix)
+
+
+class OLSMoments:
+    """Per-row pieces of the normal equations for y ~ X (X already holds the constant)."""
+
+    def __init__(self, y, X):
+        self.y = np.asarray(y, dtype=float)
+        self.X = np.asarray(X, dtype=float)
+        self.n, self.k = self.X.shape
+        self.xx = np.einsum('nk,nl->nkl', self.X, self.X).reshape(self.n, -1)
+        self.xy = self.X * self.y[:, None]
+        self.yy = self.y ** 2
+
+    def fit(self, W):
+        """Coefficients (B, k) and R^2 (B,) for a (B, n) matrix of row weights."""
+        W = np.asarray(W, dtype=float)
+        return self.fit_sums((W @ self.xx).reshape(-1, self.k, self.k), W @ self.xy,
+                             W @ self.yy, W @ self.y, W.sum(axis=1))
+
+    @staticmethod
+    def fit_sums(xtx, xty, yty, y_sum, w_sum):
+        """fit() from the weighted sums themselves: X'WX (B, k, k), X'Wy (B, k), y'Wy, sum(Wy), sum(W)."""
+        try:
+            beta = np.linalg.solve(xtx, xty[..., None])[..., 0]
+        except np.linalg.LinAlgError:  # Some resample has a constant regressor - leave just those out (NaN)
+            beta = np.full(xty.shape, np.nan)
+            for i in range(len(xtx)):
+                try:
+                    beta[i] = np.linalg.solve(xtx[i], xty[i])
+                except np.linalg.LinAlgError:
+                    pass
+        sst = yty - y_sum ** 2 / w_sum
+        ssr = yty - 2 * np.einsum('bk,bk->b', beta, xty) + np.einsum('bk,bkl,bl->b', beta, xtx, beta)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            r2 = 1 - ssr / sst
+        return beta, r2
+
+
+def resample_counts(rng, n, n_boot):
+    """(n_boot, n) draw counts from ONE (n_boot, n) matrix of resample indices."""
+    idx = rng.integers(0, n, size=(n_boot, n))
+    offsets = (np.arange(n_boot) * n)[:, None]
+    return np.bincount((idx + offsets).ravel(), minlength=n_boot * n).reshape(n_boot, n)
+
+
+def _ols_block(moments, rng, size):
+    return moments.fit(resample_counts(rng, moments.n, size))
+
+
+def bootstrap_replicates(moments, n_boot, seed, batch=BATCH):
+    """Stacked (coefficients, R^2) over n_boot resamples, one seeded block per batch."""
+    blocks = run_blocks('bootstrap OLS', _ols_block, moments, n_boot, seed, bounded_block(batch, moments.n))
+    return np.concatenate([b for b, _ in blocks]), np.concatenate([r2 for _, r2 in blocks])
+
+
+def _mean_block(x, rng, size):
+    return resample_counts(rng, len(x), size) @ x / len(x)
+
+
+def bootstrap_se(values, n_boot=N_BOOT, seed=BOOTSTRAP_SEED, batch=BATCH):
+    """Bootstrap standard error of the mean (NaN for fewer than 2 values)."""
+    x = np.asarray(values, dtype=float)
+    if len(x) < 2:
+        return np.nan
+    means = np.concatenate(run_blocks('bootstrap mean', _mean_block, x, n_boot, seed, bounded_block(batch, len(x))))
+    return means.std(ddof=1)
+
+
+def jackknife_replicates(moments):
+    """Leave-one-out (coefficients, R^2) - n fits, each the full sums minus one row's terms."""
+    n, k = moments.n, moments.k
+    return moments.fit_sums((moments.xx.sum(axis=0) - moments.xx).reshape(n, k, k),
+                            moments.xy.sum(axis=0) - moments.xy,
+                            moments.yy.sum() - moments.yy,
+                            moments.y.sum() - moments.y,
+                            np.full(n, n - 1.0))
+
+
+def percentile_interval(boot, alpha=0.05):
+    lo, hi = np.nanpercentile(boot, [100 * alpha / 2, 100 * (1 - alpha / 2)])
+    return lo, hi
+
+
+def bca_interval(boot, estimate, jack, alpha=0.05):
+    """Bias-corrected and accelerated interval (Efron 1987)."""
+    from scipy.special import ndtr, ndtri
+
+    boot = boot[~np.isnan(boot)]
+    z0 = ndtri(np.mean(boot < estimate) + 0.5 * np.mean(boot == estimate))
+    d = np.nanmean(jack) - jack
+    denom = 6 * np.nansum(d ** 2) ** 1.5
+    accel = np.nansum(d ** 3) / denom if denom > 0 else 0.0
+    z = ndtri(np.array([alpha / 2, 1 - alpha / 2]))
+    adjusted = ndtr(z0 + (z0 + z) / (1 - accel * (z0 + z)))
+    lo, hi = np.nanpercentile(boot, 100 * adjusted)
+    return lo, hi
+
+
+def bootstrap_ols(y, X, names, coef='acc', n_boot=N_BOOT, seed=BOOTSTRAP_SEED, alpha=0.05):
+    """
+    Percentile and BCa intervals for R^2 and one coefficient of y ~ X.
+    Returns {stat: {'estimate', 'percentile': (lo, hi), 'bca': (lo, hi)}}.
+    """
+    moments = OLSMoments(y, X)
+    j = list(names).index(coef)
+    estimate_beta, estimate_r2 = moments.fit(np.ones((1, moments.n)))
+    boot_beta, boot_r2 = bootstrap_replicates(moments, n_boot, seed)
+    jack_beta, jack_r2 = jackknife_replicates(moments)
+
+    results = {}
+    for stat, est, boot, jack in [('R²', estimate_r2[0], boot_r2, jack_r2),
+                                  (coef, estimate_beta[0, j], boot_beta[:, j], jack_beta[:, j])]:
+        results[stat] = {
+            'estimate': est,
+            'percentile': percentile_interval(boot, alpha),
+            'bca': bca_interval(boot, est, jack, alpha),
+        }
+    return results
+
+
+def bootstrap_model(rows, model, **kwargs):
+    """bootstrap_ols() on the rows a fitted model used (its response, constant + regressors)."""
+    X = np.column_stack([np.ones(len(rows)), rows[model.exog_names[1:]].to_numpy(dtype=float)])
+    return bootstrap_ols(rows[model.endog_name].to_numpy(dtype=float), X, model.exog_names, **kwargs)
+
+
+def print_bootstrap_table(results_by_model, n_boot=N_BOOT):
+    print(f"Bootstrap 95% CIs ({n_boot:,} resamples, seed {BOOTSTRAP_SEED}):")
+    for label, results in results_by_model.items():
+        for stat, r in results.items():
+            scale, unit = (100, '%') if stat == 'R²' else (1, '')
+            p_lo, p_hi = (v * scale for v in r['percentile'])
+            b_lo, b_hi = (v * scale for v in r['bca'])
+            print(f"  {label} {stat:<4} {r['estimate'] * scale:7.3f}{unit or ' '}  "
+                  f"percentile [{p_lo:.3f}, {p_hi:.3f}]  BCa [{b_lo:.3f}, {b_hi:.3f}]")
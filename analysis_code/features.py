@@ -0,0 +1,90 @@
+"""
+Per-respondent feature table.
+
+Most graphs used to walk raw_df.iterrows() and rebuild the same things every
+time: lowercased condition text, the ASD answer, "has condition", the
+attention checks, the branch and the standardized accessibility scores.
+build_respondent_features() derives all of that ONCE into a typed DataFrame
+(same index as the survey frame), and each graph just selects rows from it.
+
+Column positions (survey question order):
+    7 branch/usage   8 former-user conditions   10 former-user scale
+    20 former-user attention check   24 ASD   28 current-user conditions
+    29 "use 4o to manage condition(s)?"   30 current-user scale
+    38/39/40 wellbeing before/during/after   42 current-user attention check
+"""
+import numpy as np
+import pandas as pd
+
+from instrument import section
+from screening import ATTENTION_CHECKS
+
+CONDITION_STATUSES = ['has_condition', 'contradictory', 'no_conditions', 'ambiguous']
+
+
+def lower_text(s):
+    """str(v).lower() per cell, '' for missing - same as the old per-row expressions."""
+    return pd.Series([str(v).lower() if pd.notna(v) else '' for v in s], index=s.index, dtype=object)
+
+
+def contains(text, needle):
+    """Plain substring test over an object column of Python strings."""
+    return text.str.contains(needle, regex=False).astype(bool)
+
+
+def build_respondent_features(df, condition_matcher, scale):
+    """
+    One columnar pass over the survey frame.
+
+    condition_matcher: KeywordMatcher over MASTER_CONDITION_KEYWORDS
+    scale: likert.standardize_assistance_scale (answer text -> 1..5, NaN)
+    """
+    cols = df.columns
+    f = pd.DataFrame(index=df.index)
+
+    # Lowercased free text ('' when unanswered)
+    f['cond_current'] = lower_text(df[cols[28]])
+    f['cond_former'] = lower_text(df[cols[8]])
+    f['asd'] = lower_text(df[cols[24]])
+    f['use_acc'] = lower_text(df[cols[29]])
+    f['cond_combined'] = f['cond_current'] + ' ' + f['cond_former']
+
+    with section('condition + contradictory/ambiguous flags'):
+        # Condition flags (STAPLED: keywords from col_28 + col_8, ASD from col_24 only)
+        f['has_asd'] = contains(f['asd'], 'yes')
+        f['kw_current'] = condition_matcher.contains(f['cond_current'])
+        f['kw_former'] = condition_matcher.contains(f['cond_former'])
+        # Concatenation order matters for keywords that could span the joining space
+        f['kw_combined'] = condition_matcher.contains(f['cond_combined'])
+        f['kw_former_current'] = condition_matcher.contains(f['cond_former'] + ' ' + f['cond_current'])
+        f['said_no_conditions'] = contains(f['cond_current'], 'do not have')
+        f['has_cond_current'] = f['kw_current'] | f['has_asd']
+        # STAPLED condition detection: keywords in col 28 + col 8, ASD from col 24 only
+        f['has_cond'] = f['kw_combined'] | f['has_asd']
+        f['has_cond_any_order'] = f['kw_former_current'] | f['has_asd']
+
+        # Three-state status from the current-user answers (ASD/keywords checked first)
+        status = np.select(
+            [f['has_cond_current'] & f['said_no_conditions'], f['has_cond_current'], f['said_no_conditions']],
+            ['contradictory', 'has_condition', 'no_conditions'], default='ambiguous')
+        f['condition_status'] = pd.Categorical(status, categories=CONDITION_STATUSES)
+
+    # Branch and attention checks
+    branch = pd.Series([str(v) for v in df[cols[7]]], index=df.index, dtype=object)
+    f['is_current_4o'] = contains(branch, 'primarily GPT-4o')
+    f['is_former_4o'] = contains(branch.str.lower(), 'stopped') & contains(branch, 'GPT-4o')
+    f['passed_att_current'] = ATTENTION_CHECKS['current'].passed(df)  # screening.py's attention checks
+    f['passed_att_former'] = ATTENTION_CHECKS['former'].passed(df)
+
+    # Accessibility scale codes (1..5, NaN = unanswered or unrecognised)
+    f['other_purposes'] = contains(f['use_acc'], 'other purposes')
+    f['answered_current'] = df[cols[30]].notna()
+    f['answered_former'] = df[cols[10]].notna()
+    f['acc_current'] = scale.encode(df[cols[30]])
+    f['acc_former'] = scale.encode(df[cols[10]])
+
+    # Wellbeing 1-10 (NaN when missing or not a number)
+    for name, pos in [('wb_before', 38), ('wb_during', 39), ('wb_after', 40)]:
+        f[name] = pd.to_numeric(df[cols[pos]], errors='coerce').astype(float)
+
+    return f
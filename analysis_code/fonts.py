@@ -0,0 +1,51 @@
+"""
+Font resolution for matplotlib and the word cloud.
+
+The graphs are styled in Segoe UI. Where it isn't installed (our Linux render
+hosts), every text artist asked matplotlib for 'Segoe UI', missed, searched
+again and logged a findfont warning - thousands per run - before falling back
+to DejaVu Sans, and GRAPH 27's hard-coded C:/Windows/Fonts/segoeui.ttf made
+WordCloud fail outright.
+
+resolve() turns a list of preferred families into ONE concrete font file,
+once per process: the first family matplotlib's font manager has, else the
+DejaVu Sans that ships with matplotlib (what the fallback ended up drawing
+anyway). The style then names that family, so matplotlib never misses, and
+WordCloud gets the same file via font_path().
+"""
+import functools
+from pathlib import Path
+
+import matplotlib
+from matplotlib import font_manager
+from matplotlib.font_manager import FontProperties
+
+PRETTY_FONTS = ('Segoe UI', 'Arial', 'Helvetica')
+FALLBACK_FONT = Path(matplotlib.get_data_path()) / 'fonts' / 'ttf' / 'DejaVuSans.ttf'
+
+
+@functools.lru_cache(maxsize=None)
+def resolve(families=PRETTY_FONTS):
+    """(family name, font file) of the first installed family, else the bundled DejaVu Sans."""
+    for family in families:
+        try:
+            path = font_manager.findfont(FontProperties(family=family), fallback_to_default=False)
+        except ValueError:  # Not installed - no warning, unlike a fallback lookup
+            continue
+        return font_properties(path).get_name(), path
+    return font_properties(str(FALLBACK_FONT)).get_name(), str(FALLBACK_FONT)
+
+
+@functools.lru_cache(maxsize=None)
+def font_properties(path):
+    return FontProperties(fname=path)
+
+
+def font_family(families=PRETTY_FONTS):
+    """Family name to put in rcParams / fontfamily= (always one matplotlib has)."""
+    return resolve(tuple(families))[0]
+
+
+def font_path(families=PRETTY_FONTS):
+    """Font file for WordCloud(font_path=...)."""
+    return resolve(tuple(families))[1]
@@ -0,0 +1,156 @@
+"""
+Background PNG encoding and writing for the graphs.
+
+plt.savefig draws the figure, then PNG-compresses it and writes the file
+before the next graph can start. write_figure() only does the drawing on the
+render thread: a capturing Agg canvas keeps the RGBA buffer (bbox_inches,
+dpi, facecolor ... handled by savefig exactly as before) and a thread pool
+encodes and writes it while the next figure is being drawn. The encoder is
+matplotlib's own (image.imsave, same metadata), so the PNGs are the same
+bytes savefig writes.
+
+    configure(workers=2, compress_level=None, companions=('webp',), report=True)
+
+    workers         encoder threads; 0 = encode inline, like plain savefig
+    compress_level  zlib level 0-9 for the PNGs (None = Pillow's default, i.e.
+                    byte-identical to savefig)
+    companions      also write a .webp / .avif next to every PNG
+    report          print bytes written and encode time per figure at the end
+
+flush() waits for every pending write (and re-raises the first failure) -
+pipeline.render() calls it before the render cache hashes the PNGs.
+"""
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+COMPANION_FORMATS = {'webp': {'format': 'WEBP', 'quality': 90, 'method': 4},
+                     'avif': {'format': 'AVIF', 'quality': 80}}
+
+_settings = {'workers': 2, 'compress_level': None, 'companions': (), 'report': False}
+_pool = {'executor': None, 'pid': None}
+_pending = []
+_written = []  # One dict per figure written by this process
+
+
+def configure(workers=2, compress_level=None, companions=(), report=False):
+    from PIL import features
+
+    if compress_level is not None and not 0 <= compress_level <= 9:
+        raise ValueError(f"PNG compression level must be 0-9, not {compress_level}")
+    for fmt in companions:
+        if fmt not in COMPANION_FORMATS:
+            raise ValueError(f"Unknown companion format {fmt!r} (choose from {', '.join(COMPANION_FORMATS)})")
+        if not features.check(fmt):
+            raise ValueError(f"This Pillow build can't write {fmt.upper()}")
+    _settings.update(workers=max(0, int(workers)), compress_level=compress_level,
+                     companions=tuple(companions), report=bool(report))
+
+
+def output_settings():
+    """The settings that change the files written (part of the render cache key)."""
+    return {'compress_level': _settings['compress_level'], 'companions': _settings['companions']}
+
+
+class _CaptureCanvas(FigureCanvasAgg):
+    """Agg canvas whose print_png keeps the drawn RGBA buffer instead of encoding it."""
+
+    captured = None
+
+    def print_png(self, filename_or_obj, *, metadata=None, pil_kwargs=None, **kwargs):
+        # kwargs: dpi, facecolor, orientation ... which print_figure has already applied to the figure
+        FigureCanvasAgg.draw(self)
+        self.captured = (np.array(self.buffer_rgba()), self.figure.dpi, metadata)
+
+
+def capture(**savefig_kwargs):
+    """(RGBA array, dpi, metadata) of the current figure, drawn as plt.savefig would draw it."""
+    fig = plt.gcf()
+    original = fig.canvas
+    canvas = _CaptureCanvas(fig)
+    try:
+        plt.savefig(io.BytesIO(), format='png', **savefig_kwargs)
+    finally:
+        fig.set_canvas(original)
+    return canvas.captured
+
+
+def encode(path, rgba, dpi, metadata=None):
+    """Write the PNG (and companions); {'path', 'bytes', 'encode_s', 'companions'}."""
+    from PIL import Image
+
+    start = time.perf_counter()
+    level = _settings['compress_level']
+    mpl.image.imsave(path, rgba, format='png', origin='upper', dpi=dpi, metadata=metadata,
+                     pil_kwargs=None if level is None else {'compress_level': level})
+    companions = {}
+    for fmt in _settings['companions']:
+        target = Path(path).with_suffix(f'.{fmt}')
+        Image.frombuffer('RGBA', (rgba.shape[1], rgba.shape[0]), rgba, 'raw', 'RGBA', 0, 1).save(
+            target, **COMPANION_FORMATS[fmt])
+        companions[fmt] = os.path.getsize(target)
+    return {'path': str(path), 'bytes': os.path.getsize(path),
+            'encode_s': round(time.perf_counter() - start, 4), 'companions': companions}
+
+
+def _executor():
+    if _pool['executor'] is None or _pool['pid'] != os.getpid():  # Threads don't survive a fork
+        _pool['executor'] = ThreadPoolExecutor(max_workers=_settings['workers'], thread_name_prefix='png')
+        _pool['pid'] = os.getpid()
+    return _pool['executor']
+
+
+def write_figure(path, **savefig_kwargs):
+    """Draw the current figure now; encode and write it to `path` in the background."""
+    rgba, dpi, metadata = capture(**savefig_kwargs)
+    if _settings['workers'] == 0:
+        _written.append(encode(path, rgba, dpi, metadata))
+    else:
+        _pending.append(_executor().submit(encode, path, rgba, dpi, metadata))
+
+
+def flush():
+    """Wait for the pending writes; the figures written since the last drain()."""
+    pending = list(_pending)
+    _pending.clear()
+    error = None
+    for future in pending:
+        try:
+            _written.append(future.result())
+        except Exception as e:  # Let every other write finish first
+            error = error or e
+    if error is not None:
+        raise error
+    return list(_written)
+
+
+def drain():
+    """flush(), and forget the figures (a worker process hands them back this way)."""
+    written = flush()
+    _written.clear()
+    return written
+
+
+def extend(written):
+    _written.extend(written)
+
+
+def report(written=None):
+    written = flush() if written is None else written
+    if not written:
+        return
+    companions = sorted({fmt for w in written for fmt in w['companions']})
+    print(f"\n{'figure':<52}{'PNG bytes':>12}{'encode s':>10}" + ''.join(f'{fmt:>12}' for fmt in companions))
+    for w in written:
+        print(f"{w['path']:<52}{w['bytes']:>12,}{w['encode_s']:>10.3f}"
+              + ''.join(f"{w['companions'].get(fmt, 0):>12,}" for fmt in companions))
+    print(f"{f'{len(written)} figures':<52}{sum(w['bytes'] for w in written):>12,}"
+          f"{sum(w['encode_s'] for w in written):>10.3f}"
+          + ''.join(f"{sum(w['companions'].get(fmt, 0) for w in written):>12,}" for fmt in companions))
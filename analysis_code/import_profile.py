@@ -0,0 +1,81 @@
+"""
+Import-time profile for the graph script (`--import-profile`).
+
+Re-runs the same command under `python -X importtime`, lets its stdout through
+untouched, and sums the interpreter's import timings per top-level package:
+
+    Import time by package (cumulative, first import only)
+      top level: 1319.7 ms
+        pandas               615.0 ms
+        ...
+      lazy: 2011.4 ms
+        statsmodels         1870.5 ms
+        ...
+
+"top level" packages (imported before main() starts) are paid by EVERY run;
+lazy ones only by runs that render a graph needing them (GRAPH 8, 27, 28, 37,
+38 and the regression stage).
+"""
+import os
+import re
+import subprocess
+import sys
+
+# "import time:       123 |       4567 | package.module" (self / cumulative in us)
+_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+# The profiled script writes this line to stderr when main() starts (see mark_startup_done)
+MARKER = 'import-profile: main() started'
+ENV_FLAG = 'GRAPHS_IMPORT_PROFILE'
+
+
+def mark_startup_done():
+    """Called at the top of main(): everything imported after this point is lazy."""
+    if os.environ.get(ENV_FLAG):
+        print(MARKER, file=sys.stderr, flush=True)
+
+
+def parse_importtime(lines):
+    """
+    {(phase, top-level package): cumulative microseconds} from -X importtime lines,
+    outermost imports only. phase is 'top level' before MARKER and 'lazy' after it.
+    """
+    totals = {}
+    phase = 'top level'
+    for line in lines:
+        if line.startswith(MARKER):
+            phase = 'lazy'
+            continue
+        m = _LINE.match(line)
+        if not m or len(m.group(3)) > 1:  # Deeper indent = counted in its parent's cumulative time
+            continue
+        key = (phase, m.group(4).split('.')[0])
+        totals[key] = totals.get(key, 0) + int(m.group(2))
+    return totals
+
+
+def print_report(totals, top=12, file=sys.stdout):
+    print("\nImport time by package (cumulative, first import only)", file=file)
+    for phase in ['top level', 'lazy']:
+        ranked = sorted(((p, us) for (ph, p), us in totals.items() if ph == phase),
+                        key=lambda kv: kv[1], reverse=True)
+        subtotal = sum(us for _, us in ranked)
+        print(f"  {phase}: {subtotal / 1000:.1f} ms", file=file)
+        for package, us in ranked[:top]:
+            print(f"    {package:<28}{us / 1000:>9.1f} ms", file=file)
+
+
+def run_profiled(script, argv):
+    """Run `script argv` under -X importtime, forward its output, then print the report."""
+    proc = subprocess.Popen([sys.executable, '-X', 'importtime', script, *argv],
+                            stderr=subprocess.PIPE, text=True, encoding='utf-8', errors='replace',
+                            env={**os.environ, ENV_FLAG: '1'})
+    timings = []
+    for line in proc.stderr:
+        if line.startswith(('import time:', MARKER)):
+            timings.append(line)
+        else:
+            sys.stderr.write(line)
+    proc.wait()
+    print_report(parse_importtime(timings))
+    return proc.returncode
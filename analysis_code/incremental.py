@@ -0,0 +1,208 @@
+"""
+Incremental re-runs while the survey keeps collecting responses.
+
+    python all_pretty_graphs_v3.py render --incremental [STATE.json]
+
+The state file records the last processed Timestamp (column 0), how many rows
+were at or before it, and the running statistics below. Next to it, STATE.pkl
+keeps the screened frames and the feature table of those rows. A run
+
+  - reads the survey and checks that the processed rows are still exactly the
+    first N rows with Timestamp <= last (if not - rows edited, deleted,
+    re-sorted, or another file - it rebuilds from scratch),
+  - screens and builds features for the NEW rows only, and appends them,
+  - folds the new rows into the sufficient statistics (RunningStats): n/mean/M2
+    of the wellbeing scores and the regression Gram matrices (gram_ols.py),
+  - hands the full frames to the graphs. The render cache then re-renders
+    only the figures whose inputs changed.
+
+With no new rows nothing is screened or rebuilt at all.
+
+    python incremental.py [survey.xlsx] [--new K] [--format xlsx|csv|parquet]
+
+checks that N rows and then N+K rows give the same frames and printed
+statistics as one from-scratch run over the N+K rows.
+"""
+import json
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from gram_ols import GramAccumulator
+from survey_cache import load_survey
+from survey_schema import concat_compact, refit
+from survey_stream import iter_chunks
+
+INCREMENTAL_STATE = 'incremental_state.json'
+STATE_VERSION = 3
+
+
+class RunningStats:
+    """Sufficient statistics that new rows are added to, never recomputed."""
+
+    def __init__(self, moments=None, gram=None):
+        self.moments = moments or {}  # name -> [n, mean, M2]
+        self.gram = gram              # GramAccumulator over the regression rows (gram_ols.py)
+
+    def add_moments(self, name, values):
+        """Chan et al.'s pairwise update of count, mean and sum of squared deviations."""
+        x = np.asarray(values, dtype=float)
+        x = x[~np.isnan(x)]
+        if not len(x):
+            return
+        n_a, mean_a, m2_a = self.moments.get(name, [0, 0.0, 0.0])
+        n_b, mean_b = len(x), float(x.mean())
+        m2_b = float(((x - mean_b) ** 2).sum())
+        n = n_a + n_b
+        delta = mean_b - mean_a
+        self.moments[name] = [n, mean_a + delta * n_b / n, m2_a + m2_b + delta ** 2 * n_a * n_b / n]
+
+    def mean_std(self, name):
+        n, mean, m2 = self.moments.get(name, [0, np.nan, np.nan])
+        return n, mean, np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+
+    def add_regression_rows(self, df, regressors, response='wb'):
+        """Add rows to the X'X/X'y Gram matrices (one per missingness pattern)."""
+        if self.gram is None:
+            self.gram = GramAccumulator(regressors, response)
+        self.gram.add(df)
+
+    def to_json(self):
+        return {'moments': self.moments,
+                'gram': None if self.gram is None else self.gram.to_json()}
+
+    @classmethod
+    def from_json(cls, state):
+        gram = GramAccumulator.from_json(state['gram']) if state['gram'] else None
+        return cls(state['moments'], gram)
+
+
+def read_new_rows(source, last, n_done):
+    """
+    (rows with Timestamp > last, consistent). consistent: the rows at or before
+    `last` are exactly the first n_done rows, i.e. only appended rows are new.
+    """
+    chunks = iter_chunks(source.path, source.chunksize) if source.streaming else [load_survey(source.path)]
+    new_parts, n_old, consistent = [], 0, True
+    for chunk in chunks:
+        if last is None:
+            new_parts.append(chunk)
+            continue
+        old = (pd.to_datetime(chunk.iloc[:, 0]) <= last).to_numpy()
+        n_old += int(old.sum())
+        consistent &= bool((chunk.index[old] < n_done).all())
+        new_parts.append(chunk[~old])
+    consistent &= n_old == n_done
+    rows = pd.concat(new_parts) if len(new_parts) > 1 else new_parts[0]
+    return rows, consistent
+
+
+def update(source, state_path, process, add_stats):
+    """
+    The screened survey with the rows added since the last run.
+
+    process(rows) -> (unfiltered part, screened part, features part) for new rows.
+    add_stats(stats, screened part, features part) folds them into a RunningStats.
+    Returns (raw_df_unfiltered, raw_df, features, stats, n_new, last Timestamp before this run).
+    """
+    state_path = Path(state_path)
+    frames_path = state_path.with_suffix('.pkl')
+    mode = {'source': str(source.path), 'streaming': source.streaming,
+            'text_columns': list(source.text_columns)}
+    state = json.loads(state_path.read_text()) if state_path.exists() else None
+    if (state is None or state.get('version') != STATE_VERSION or state.get('mode') != mode
+            or not frames_path.exists()):
+        state = None
+
+    last = pd.Timestamp(state['last_timestamp']) if state and state['last_timestamp'] else None
+    rows, consistent = read_new_rows(source, last, state['rows'] if state else 0)
+    if state is not None and not consistent:
+        print(f"INCREMENTAL: {source.path} no longer starts with the {state['rows']} processed rows - rebuilding")
+        state, last = None, None
+        rows, _ = read_new_rows(source, None, 0)
+
+    if state is None:
+        stats, frames = RunningStats(), None
+    else:
+        stats = RunningStats.from_json(state['stats'])
+        with open(frames_path, 'rb') as f:
+            frames = pickle.load(f)
+
+    n_new = len(rows)
+    if n_new or frames is None:  # A first run over an empty export still saves (empty) frames
+        unfiltered, screened, features = process(rows)
+        add_stats(stats, screened, features)
+        if frames is not None:
+            unfiltered = concat_compact([frames['raw_df_unfiltered'], unfiltered])
+            screened = concat_compact([frames['raw_df'], screened])
+            features = pd.concat([frames['features'], features])
+        frames = {'raw_df_unfiltered': refit(unfiltered), 'raw_df': refit(screened), 'features': features}
+        total = len(frames['raw_df_unfiltered'])
+        timestamps = pd.to_datetime(frames['raw_df_unfiltered'].iloc[:, 0])
+        last_timestamp = timestamps.max().isoformat() if total else None  # None: nothing processed yet
+        with open(frames_path, 'wb') as f:
+            pickle.dump(frames, f, protocol=pickle.HIGHEST_PROTOCOL)
+        state_path.write_text(json.dumps({
+            'version': STATE_VERSION, 'mode': mode, 'rows': total,
+            'last_timestamp': last_timestamp, 'stats': stats.to_json(),
+        }, ensure_ascii=False, indent=1))
+    return frames['raw_df_unfiltered'], frames['raw_df'], frames['features'], stats, n_new, last
+
+
+if __name__ == '__main__':
+    # Self-check: render --incremental over the first N rows and then all N+k rows gives
+    # the same frames and printed statistics as one from-scratch run over the N+k rows
+    import argparse
+    import contextlib
+    import io
+    import os
+    import sys
+    import tempfile
+
+    import all_pretty_graphs_v3 as script
+    from survey_stream import SurveySource
+
+    parser = argparse.ArgumentParser(description='Incremental (N, then N+k rows) vs from-scratch parity check.')
+    parser.add_argument('path', nargs='?', default=script.SURVEY_PATH)
+    parser.add_argument('--new', type=int, default=9, help='rows added by the second run (k)')
+    parser.add_argument('--format', choices=['xlsx', 'csv', 'parquet'], default='xlsx',
+                        help='xlsx = the workbook path, csv/parquet = the --stream path')
+    parser.add_argument('--chunksize', type=int, default=50)
+    args = parser.parse_args()
+
+    full = load_survey(args.path)
+    writers = {'xlsx': lambda df, p: df.to_excel(p, index=False), 'csv': lambda df, p: df.to_csv(p, index=False),
+               'parquet': lambda df, p: df.to_parquet(p, index=False)}
+
+    def run(source, state):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            frames = script.incremental_survey(source, state)
+        lines = out.getvalue().splitlines()
+        start = next(i for i, line in enumerate(lines) if line.startswith('SCREENING:'))
+        # Everything printed from the screening summary on, except the "+k new since ..." line
+        return frames, [line for line in lines[start:] if not line.startswith('INCREMENTAL:')]
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            path = f'survey.{args.format}'
+            source = SurveySource(path, args.chunksize if args.format != 'xlsx' else None)
+            writers[args.format](full.iloc[:len(full) - args.new], path)
+            run(source, 'state.json')
+            writers[args.format](full, path)
+            appended, appended_log = run(source, 'state.json')
+            scratch, scratch_log = run(source, 'scratch.json')
+        finally:
+            os.chdir(cwd)
+
+    for name, a, b in zip(['raw_df_unfiltered', 'raw_df', 'features'], appended, scratch):
+        pd.testing.assert_frame_equal(a, b, obj=name)
+    if appended_log != scratch_log:
+        sys.exit('\n'.join(['Printed statistics differ (incremental, then from scratch):']
+                           + [f'  {a!r}\n  {b!r}' for a, b in zip(appended_log, scratch_log) if a != b]))
+    print(f"{args.format}: {len(full) - args.new} rows, then +{args.new} == from scratch over {len(full)} rows "
+          f"(frames and {len(scratch_log)} printed lines)")
@@ -0,0 +1,151 @@
+"""
+Per-section timing and memory instrumentation.
+
+    with section('screening'):
+        flags = screen_responses(survey)
+
+Off by default - section() then costs one dict lookup. After enable(), every
+section records
+
+    wall_s / cpu_s           perf_counter / process_time spent inside
+    rss_peak_mib             the process's peak RSS when the section ended,
+    rss_growth_mib           and how much the section raised it
+    alloc_delta_mib          tracemalloc: memory still allocated at the end
+    alloc_peak_mib           tracemalloc: highest allocation above the start
+
+Sections nest (a graph inside the run, 'screening' inside the load stage):
+each record has its parent and depth, and an inner section's allocation peak
+counts towards its parents' peaks too. pipeline.py opens one section per stage
+and per graph, tagged with the stage/graph's `section` group (e.g.
+'REGRESSION CITY'), so the groups get subtotals in the summary.
+
+Records are appended to a JSONL log (one object per line, all sections of one
+run share a `run` id) and summary() prints them as a table at the end.
+"""
+import contextlib
+import datetime
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+INSTRUMENT_LOG = 'instrumentation.jsonl'
+
+_state = {'enabled': False, 'run': None}
+_records = []
+_stack = []  # Open sections: {'name', 'peak'} (peak = highest traced allocation seen so far)
+
+MIB = 2 ** 20
+
+
+def enable(run=None):
+    """Start recording (and tracing allocations) in this process."""
+    _state['enabled'] = True
+    _state['run'] = run or datetime.datetime.now().isoformat(timespec='seconds')
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def enabled():
+    return _state['enabled']
+
+
+def run_id():
+    return _state['run']
+
+
+def peak_rss():
+    """Peak resident set size of this process in MiB (None where it can't be read)."""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / MIB if sys.platform == 'darwin' else peak / 1024  # bytes on macOS, KiB on Linux
+    try:
+        import psutil
+        return psutil.Process().memory_info().peak_wset / MIB
+    except (ImportError, AttributeError):
+        return None
+
+
+@contextlib.contextmanager
+def section(name, group=None):
+    """Record wall/CPU time, peak RSS and traced allocations of the enclosed block."""
+    if not _state['enabled']:
+        yield
+        return
+    current, peak = tracemalloc.get_traced_memory()
+    if _stack:  # reset_peak() below would lose the enclosing section's peak so far
+        _stack[-1]['peak'] = max(_stack[-1]['peak'], peak)
+    tracemalloc.reset_peak()
+    frame = {'name': name, 'peak': current}
+    # Appended now and filled in at the end, so a section is listed before the ones inside it
+    record = {'run': _state['run'], 'name': name, 'group': group,
+              'parent': _stack[-1]['name'] if _stack else None, 'depth': len(_stack), 'pid': os.getpid()}
+    _records.append(record)
+    _stack.append(frame)
+    rss_before = peak_rss()
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        yield
+    finally:
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+        end, peak = tracemalloc.get_traced_memory()
+        _stack.pop()
+        peak = max(frame['peak'], peak)
+        if _stack:
+            _stack[-1]['peak'] = max(_stack[-1]['peak'], peak)
+        rss_after = peak_rss()
+        record.update({
+            'wall_s': round(wall, 4), 'cpu_s': round(cpu, 4),
+            'rss_peak_mib': None if rss_after is None else round(rss_after, 1),
+            'rss_growth_mib': None if rss_after is None else round(rss_after - rss_before, 1),
+            'alloc_delta_mib': round((end - current) / MIB, 2),
+            'alloc_peak_mib': round((peak - current) / MIB, 2),
+        })
+
+
+def drain():
+    """The records so far, removed (a worker process hands them back this way)."""
+    records = list(_records)
+    _records.clear()
+    return records
+
+
+def extend(records):
+    _records.extend(records)
+
+
+def write_log(path=INSTRUMENT_LOG):
+    """Append this run's records to the JSONL log."""
+    with open(path, 'a', encoding='utf-8') as f:
+        for record in _records:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+
+def summary(records=None):
+    records = _records if records is None else records
+    if not records:
+        return
+    print(f"\n{'section':<44}{'wall s':>9}{'cpu s':>9}{'peak RSS':>10}{'alloc Δ':>10}{'alloc peak':>11}")
+
+    def mib(v):
+        return '-' if v is None else f'{v:.1f}M'
+
+    for r in records:
+        name = '  ' * r['depth'] + r['name']
+        print(f"{name:<44}{r['wall_s']:>9.3f}{r['cpu_s']:>9.3f}{mib(r['rss_peak_mib']):>10}"
+              f"{mib(r['alloc_delta_mib']):>10}{mib(r['alloc_peak_mib']):>11}")
+    top = [r for r in records if r['depth'] == 0]
+    groups = {}
+    for r in top:
+        if r['group']:
+            wall, cpu, n = groups.get(r['group'], (0.0, 0.0, 0))
+            groups[r['group']] = (wall + r['wall_s'], cpu + r['cpu_s'], n + 1)
+    for group, (wall, cpu, n) in groups.items():
+        print(f"{group + f' ({n} sections)':<44}{wall:>9.3f}{cpu:>9.3f}")
+    print(f"{'sum of sections':<44}{sum(r['wall_s'] for r in top):>9.3f}{sum(r['cpu_s'] for r in top):>9.3f}")
@@ -0,0 +1,81 @@
+"""
+Multi-pattern keyword matcher for the condition keyword lists.
+
+`any(kw in text for kw in MASTER_CONDITION_KEYWORDS)` scans the text once per
+keyword. KeywordMatcher compiles the whole list into ONE alternation regex, so a
+single left-to-right pass answers "does any keyword occur?" and - through a
+zero-width lookahead - reports EVERY keyword that occurs, overlapping ones
+included.
+
+Semantics are exactly those of plain substring checks (`kw in text`), quirks and
+all: 'add' still matches inside 'address' and 'did' inside "didn't".
+"""
+import re
+
+import pandas as pd
+
+
+class KeywordMatcher:
+    """Compiled substring matcher built once from a keyword list."""
+
+    def __init__(self, keywords):
+        self.keywords = list(dict.fromkeys(keywords))  # De-duplicate, keep list order
+        if not self.keywords:
+            alternation = '(?!)'  # Never matches
+        else:
+            # Longest first, so at each position the regex captures the LONGEST keyword
+            # that starts there. Every other keyword starting at that position is a
+            # prefix of it, and gets added back through self._prefixes.
+            ordered = sorted(self.keywords, key=len, reverse=True)
+            alternation = '|'.join(re.escape(kw) for kw in ordered)
+        self._any = re.compile(alternation)
+        self._all = re.compile(f'(?=({alternation}))')
+        self._prefixes = {kw: [other for other in self.keywords if kw.startswith(other)]
+                          for kw in self.keywords}
+
+    def __repr__(self):
+        return f'KeywordMatcher({len(self.keywords)} keywords)'
+
+    def search(self, text):
+        """True if any keyword is a substring of text (== any(kw in text ...))."""
+        return self._any.search(text) is not None
+
+    def findall(self, text):
+        """Every keyword that occurs in text, in keyword-list order."""
+        found = set()
+        for m in self._all.finditer(text):
+            found.update(self._prefixes[m.group(1)])
+        return [kw for kw in self.keywords if kw in found]
+
+    @classmethod
+    def from_groups(cls, groups):
+        """One matcher over every keyword of a {group name: [keywords]} dict."""
+        return cls(kw for kws in groups.values() for kw in kws)
+
+    def groups_in(self, text, groups):
+        """Names of the groups with at least one keyword in text (dict order), from one pass."""
+        found = set(self.findall(text))
+        return [name for name, kws in groups.items() if any(kw in found for kw in kws)]
+
+    def contains(self, texts):
+        """
+        Vectorized search() over a Series of (already lowercased) strings.
+        Survey answers repeat a lot, so each DISTINCT text is matched only once.
+        """
+        hits = {t: self.search(t) for t in pd.unique(texts)}
+        return texts.map(hits).astype(bool)
+
+    def match_groups(self, texts, groups):
+        """
+        One boolean column per group (e.g. CONDITION -> [its keywords]): True when
+        any of that group's keywords occurs in the text. All groups are answered
+        from a single findall() per distinct text.
+        """
+        columns = {name: [] for name in groups}
+        uniques = pd.unique(texts)
+        for text in uniques:
+            hit = set(self.groups_in(text, groups))
+            for name in groups:
+                columns[name].append(name in hit)
+        lookup = pd.DataFrame(columns, index=pd.Index(uniques, dtype=object))
+        return lookup.reindex(pd.Index(texts, dtype=object)).set_axis(texts.index).astype(bool)
@@ -0,0 +1,212 @@
+"""
+Vectorized encoders for the Likert / multiple-choice answers.
+
+The old helpers (standardize_assistance_scale, hours_code, age_code, ...)
+lowercased ONE value and ran an if/elif chain of `in` checks, and were mapped
+row by row. Here each helper is a LikertEncoder: the same chain written as an
+ordered rule table. encoder.encode(series) runs the chain once per DISTINCT
+answer (or per category of a Categorical column) and broadcasts the codes back.
+
+Rules are tried top to bottom and the first hit wins, exactly like the
+if/elif chains they replace - e.g. gender checks 'female' before 'male'.
+Answers no rule matches give `default` (None -> NaN); missing answers are
+always NaN.
+
+An encoder is still callable on a single value: encoder(value) -> code / None.
+
+    python likert.py [survey.xlsx]
+
+checks every distinct workbook answer against the original if/elif helpers.
+"""
+import numpy as np
+import pandas as pd
+
+
+class LikertEncoder:
+    """Ordered (needles, code) rules: the code of the first rule with a needle in the answer."""
+
+    def __init__(self, name, rules, default=None):
+        self.name = name
+        self.rules = [(tuple(needles), code) for needles, code in rules]
+        self.default = default  # For answered values no rule matches (missing is always None/NaN)
+
+    def __repr__(self):
+        return f'LikertEncoder({self.name!r}, {self.rules!r}, default={self.default!r})'
+
+    def __call__(self, value):
+        if pd.isna(value):
+            return None
+        text = str(value).lower()
+        for needles, code in self.rules:
+            if any(n in text for n in needles):
+                return code
+        return self.default
+
+    def codes_for(self, values):
+        """Codes (float, NaN for no code) for an array of distinct non-missing answers."""
+        lowered = pd.Series([str(v).lower() for v in values], dtype=object)
+        hits = [np.logical_or.reduce([lowered.str.contains(n, regex=False).to_numpy(bool) for n in needles])
+                for needles, _ in self.rules]
+        default = np.nan if self.default is None else self.default
+        return np.select(hits, [code for _, code in self.rules], default=default).astype(float)
+
+    def encode(self, s):
+        """Vectorized self(v) over a Series: float codes, NaN for missing/unmatched answers."""
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            distinct = s.cat.categories
+        else:
+            distinct = pd.unique(s.dropna())
+        table = pd.Series(self.codes_for(distinct), index=pd.Index(distinct, dtype=object))
+        return s.map(table).astype(float)
+
+
+# Accessibility scale (col_30 current users / col_10 former users) -> 1..5
+standardize_assistance_scale = LikertEncoder('assistance scale', [
+    (['not assist', 'not applicable'], 1),
+    (['minimal', '1 -'], 2),
+    (['moderate', '2 -'], 3),
+    (['significant', '3 -'], 4),
+    (['essential', '4 -'], 5),
+])
+
+# GRAPH 8 versions - checked from the top of the scale down, so precedence differs
+map_access_g8 = LikertEncoder('access (GRAPH 8)', [
+    (['essential', '4 -'], 5),
+    (['significant', '3 -'], 4),
+    (['moderate', '2 -'], 3),
+    (['minimal', '1 -'], 2),
+    (['not assist', 'did not'], 1),
+])
+
+map_impact_g8 = LikertEncoder('impact (GRAPH 8)', [
+    (['catastrophic'], 5),
+    (['severe'], 4),
+    (['moderate'], 3),
+    (['minimal'], 2),
+    (['no significant'], 1),
+])
+
+# Regression controls (from clean_model_with_controls.py)
+hours_code = LikertEncoder('hours per day', [
+    (['less than 30'], 0),
+    (['30 minutes'], 1),
+    (['1-2'], 2),
+    (['2-4'], 3),
+    (['4-6'], 4),
+    (['more than 6'], 5),
+])
+
+age_code = LikertEncoder('age', [
+    (['18-24'], 21),
+    (['25-34'], 30),
+    (['35-44'], 40),
+    (['45-54'], 50),
+    (['55-64'], 60),
+    (['65'], 70),
+])
+
+# 'male' in v and 'female' not in v -> 1, otherwise 0
+gender_code = LikertEncoder('gender', [(['female'], 0), (['male'], 1)], default=0)
+
+is_usa = LikertEncoder('country is USA', [(['united states'], 1)], default=0)
+
+
+if __name__ == '__main__':
+    import sys
+
+    from survey_cache import load_survey
+
+    # The if/elif helpers as they were, for the parity check
+    def legacy_scale(value):
+        if pd.isna(value):
+            return None
+        val = str(value).lower()
+        if 'not assist' in val or 'not applicable' in val:
+            return 1
+        elif 'minimal' in val or '1 -' in val:
+            return 2
+        elif 'moderate' in val or '2 -' in val:
+            return 3
+        elif 'significant' in val or '3 -' in val:
+            return 4
+        elif 'essential' in val or '4 -' in val:
+            return 5
+        return None
+
+    def legacy_access_g8(val):
+        if pd.isna(val): return np.nan
+        val = str(val).lower()
+        if 'essential' in val or '4 -' in val: return 5
+        if 'significant' in val or '3 -' in val: return 4
+        if 'moderate' in val or '2 -' in val: return 3
+        if 'minimal' in val or '1 -' in val: return 2
+        if 'not assist' in val or 'did not' in val: return 1
+        return np.nan
+
+    def legacy_impact_g8(val):
+        if pd.isna(val): return np.nan
+        val = str(val).lower()
+        if 'catastrophic' in val: return 5
+        if 'severe' in val: return 4
+        if 'moderate' in val: return 3
+        if 'minimal' in val: return 2
+        if 'no significant' in val: return 1
+        return np.nan
+
+    def legacy_hours(v):
+        if pd.isna(v): return None
+        v = str(v).lower()
+        if 'less than 30' in v: return 0
+        elif '30 minutes' in v: return 1
+        elif '1-2' in v: return 2
+        elif '2-4' in v: return 3
+        elif '4-6' in v: return 4
+        elif 'more than 6' in v: return 5
+        return None
+
+    def legacy_age(v):
+        if pd.isna(v): return None
+        v = str(v).lower()
+        if '18-24' in v: return 21
+        elif '25-34' in v: return 30
+        elif '35-44' in v: return 40
+        elif '45-54' in v: return 50
+        elif '55-64' in v: return 60
+        elif '65' in v: return 70
+        return None
+
+    def legacy_gender(v):
+        if pd.isna(v): return None
+        v = str(v).lower()
+        if 'male' in v and 'female' not in v: return 1
+        return 0
+
+    def legacy_usa(v):
+        if pd.isna(v): return None
+        return 1 if 'united states' in str(v).lower() else 0
+
+    # (encoder, reference, workbook columns it is applied to)
+    checks = [
+        (standardize_assistance_scale, legacy_scale, [10, 30]),
+        (map_access_g8, legacy_access_g8, [30]),
+        (map_impact_g8, legacy_impact_g8, [43]),
+        (hours_code, legacy_hours, [34]),
+        (age_code, legacy_age, [3]),
+        (gender_code, legacy_gender, [4]),
+        (is_usa, legacy_usa, [5]),
+    ]
+    df = load_survey(sys.argv[1] if len(sys.argv) > 1 else 'survey (Responses) (version 3).xlsx')
+    failures = 0
+    for encoder, legacy, positions in checks:
+        for pos in positions:
+            values = pd.Series(pd.unique(df.iloc[:, pos]), dtype=object)
+            expected = values.map(legacy).astype(float)
+            for got in (encoder.encode(values), encoder.encode(values.astype('category')),
+                        values.map(encoder).astype(float)):
+                bad = ~((got == expected) | (got.isna() & expected.isna()))
+                failures += int(bad.sum())
+                for v in values[bad]:
+                    print(f"  MISMATCH {encoder.name} col {pos}: {v!r}")
+            print(f"{encoder.name:<20} col {pos:>2}: {len(values)} distinct answers checked")
+    print("OK - vectorized encoders match the if/elif helpers" if not failures else f"{failures} mismatches")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,121 @@
+"""
+Vectorized two-group permutation tests (chi-square, Mann-Whitney, difference in means).
+
+Used for the group comparisons the graphs draw but never tested:
+GRAPH 3 (current vs former users' accessibility levels), GRAPH 7 (wellbeing
+with vs without conditions) and GRAPH 16/17 (routing impact with vs without
+conditions).
+
+Under H0 the group labels are exchangeable. A batch of B relabellings is one
+(B, n) matrix of permuted indices; position j goes to group A when its index is
+< n_a. Every statistic is linear in that 0/1 membership matrix L:
+
+    sum of A's values         L @ x            -> difference in means
+    sum of A's pooled ranks   L @ ranks        -> Mann-Whitney U
+    A's count per category    L @ one_hot      -> chi-square (margins are fixed)
+
+so 100,000 permutations are a handful of matmuls. p-values are two-sided,
+(1 + #{|T_perm| >= |T_obs|}) / (1 + n_perm). Each batch is a block with its
+own seeded generator (resample_pool), so p-values don't depend on the number
+of workers.
+"""
+import numpy as np
+import pandas as pd
+
+from resample_pool import bounded_block, run_blocks
+
+N_PERM = 100_000
+PERMUTATION_SEED = 20250807
+BATCH = 10_000  # Permutations per block / (B, n) index matrix
+STATISTICS = ('chi2', 'mannwhitney', 'mean_diff')
+
+
+def _ranks(x):
+    """Average ranks (ties share the mean rank) - the Mann-Whitney pooled ranks."""
+    return pd.Series(x).rank(method='average').to_numpy()
+
+
+class TwoGroupTest:
+    """The pooled sample of groups a and b, ready for batched relabelling."""
+
+    def __init__(self, a, b, statistics=STATISTICS):
+        a, b = list(a), list(b)
+        self.n_a, self.n = len(a), len(a) + len(b)
+        self.statistics = tuple(statistics)
+        pooled = pd.Series(a + b)
+        if {'mannwhitney', 'mean_diff'} & set(self.statistics):
+            self.x = pooled.astype(float).to_numpy()
+            self.ranks = _ranks(self.x)
+            self.total = self.x.sum()
+        if 'chi2' in self.statistics:
+            codes, _ = pd.factorize(pooled)
+            self.one_hot = np.eye(codes.max() + 1)[codes]
+            col_totals = self.one_hot.sum(axis=0)
+            # Expected counts only depend on the margins, which relabelling never changes
+            self.expected_a = col_totals * self.n_a / self.n
+            self.expected_b = col_totals * (self.n - self.n_a) / self.n
+
+    def compute(self, L):
+        """{statistic: values} for a (B, n) 0/1 matrix of group-A membership."""
+        n_b = self.n - self.n_a
+        out = {}
+        if 'mean_diff' in self.statistics:
+            sum_a = L @ self.x
+            out['mean_diff'] = sum_a / self.n_a - (self.total - sum_a) / n_b
+        if 'mannwhitney' in self.statistics:
+            out['mannwhitney'] = L @ self.ranks - self.n_a * (self.n_a + 1) / 2
+        if 'chi2' in self.statistics:
+            obs_a = L @ self.one_hot
+            obs_b = self.one_hot.sum(axis=0) - obs_a
+            out['chi2'] = (((obs_a - self.expected_a) ** 2 / self.expected_a).sum(axis=-1)
+                           + ((obs_b - self.expected_b) ** 2 / self.expected_b).sum(axis=-1))
+        return out
+
+    def centred(self, stats):
+        """Distance from H0 that the two-sided p-value compares (chi-square is one-sided by nature)."""
+        out = dict(stats)
+        if 'mannwhitney' in out:
+            out['mannwhitney'] = np.abs(out['mannwhitney'] - self.n_a * (self.n - self.n_a) / 2)
+        if 'mean_diff' in out:
+            out['mean_diff'] = np.abs(out['mean_diff'])
+        return out
+
+    def observed(self):
+        L = np.zeros((1, self.n))
+        L[0, :self.n_a] = 1
+        return {name: v[0] for name, v in self.compute(L).items()}
+
+    def exceedances(self, rng, size):
+        """{statistic: how many of `size` relabellings are at least as extreme as observed}."""
+        observed = self.centred({k: np.array([v]) for k, v in self.observed().items()})
+        idx = rng.permuted(np.tile(np.arange(self.n), (size, 1)), axis=1)
+        L = (idx < self.n_a).astype(float)
+        # Relative tolerance so float round-off can't hide exact ties with T_obs
+        return {name: int(np.sum(values >= observed[name] * (1 - 1e-12) - 1e-12))
+                for name, values in self.centred(self.compute(L)).items()}
+
+
+def _permutation_block(test, rng, size):
+    return test.exceedances(rng, size)
+
+
+def permutation_test(a, b, statistics=STATISTICS, n_perm=N_PERM, seed=PERMUTATION_SEED):
+    """
+    Two-sided permutation test of group a vs group b.
+    Returns {statistic: (observed value, p-value)}; 'chi2' treats the values as categories.
+    """
+    test = TwoGroupTest(a, b, statistics)
+    if test.n_a == 0 or test.n_a == test.n:
+        return {name: (np.nan, np.nan) for name in test.statistics}
+    blocks = run_blocks('permutation test', _permutation_block, test, n_perm, seed, bounded_block(BATCH, test.n))
+    observed = test.observed()
+    return {name: (observed[name], (1 + sum(b[name] for b in blocks)) / (1 + n_perm))
+            for name in test.statistics}
+
+
+STAT_LABELS = {'chi2': 'χ²', 'mannwhitney': 'Mann-Whitney U', 'mean_diff': 'Δ mean'}
+
+
+def format_results(results, n_perm=N_PERM):
+    parts = [f"{STAT_LABELS[name]} = {value:.3f} (p = {p:.4f})" for name, (value, p) in results.items()]
+    return f"Permutation test ({n_perm:,} perms): " + ', '.join(parts)
@@ -0,0 +1,226 @@
+"""
+Stage / graph registry and runner for the graph script.
+
+Shared data (screened survey, feature table, regression dataset, ...) is
+produced by STAGES and consumed by GRAPHS. Both declare what they need just
+by naming it as a parameter:
+
+    @stage('features')
+    def respondent_features(raw_df): ...
+
+    @graph('7')
+    def graph_7(features): ...
+
+render() computes each needed stage once - and ONLY the stages the selected
+graphs need - then hands the graphs their inputs. With jobs > 1 the stages run
+first in this process, then the graphs are spread over a process pool (Agg backend, one copy of the shared data per worker).
+Each worker's stdout - and each stage's, held back until the first graph that
+needs it - is printed in graph order, so the log reads the same as a serial
+run and every PNG is identical to the serial one. Stages marked upfront=True
+(screening, the feature table) run before the first graph either way.
+
+Every stage and graph call runs inside an instrument.section() named after
+it (a no-op unless instrumentation is on); `section=` on the decorator tags
+it with a group such as 'REGRESSION CITY'.
+
+Graphs save through image_writer, which encodes and writes the PNGs in the
+background; render() waits for those writes before the render cache hashes
+the files, and workers hand their write stats back with the log text.
+"""
+import contextlib
+import inspect
+import io
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import image_writer
+import instrument
+
+STAGES = {}  # data name -> Stage
+GRAPHS = {}  # graph key -> Graph, in definition (= report) order
+
+
+class Stage:
+    def __init__(self, func, provides, section=None, upfront=False):
+        self.func = func
+        self.provides = provides
+        self.section = section  # Instrumentation group
+        self.upfront = upfront  # Run before the first graph (when needed at all), not when first needed
+        self.needs = tuple(inspect.signature(func).parameters)
+
+
+class Graph:
+    def __init__(self, key, func, outputs, section=None, reads=()):
+        self.key = key
+        self.func = func
+        self.outputs = outputs  # Files the graph writes (used by the render cache)
+        self.section = section
+        self.reads = tuple(reads)  # Files the graph opens itself (their content is part of its cache key)
+        self.needs = tuple(inspect.signature(func).parameters)
+
+
+def stage(*provides, section=None, upfront=False):
+    """
+    Register a stage. With several names, the function returns a tuple in that order.
+    upfront=True: computed before the first graph, like the script's top-level setup was,
+    so its log output comes first; other stages run right before the first graph needing them.
+    """
+    def register(func):
+        s = Stage(func, provides, section, upfront)
+        for name in provides:
+            STAGES[name] = s
+        return func
+    return register
+
+
+def graph(key, *outputs, section=None, reads=()):
+    def register(func):
+        GRAPHS[key] = Graph(key, func, outputs, section, reads)
+        return func
+    return register
+
+
+def _call(g, data):
+    """Run a graph on its inputs from data, as one instrumented section."""
+    with instrument.section(f'GRAPH {g.key}', g.section):
+        g.func(*(data[n] for n in g.needs))
+
+
+def select(keys=None):
+    """Graph keys in report order (all of them for None). Unknown keys raise KeyError."""
+    if keys is None:
+        return list(GRAPHS)
+    wanted = [str(k).strip() for k in keys if str(k).strip()]
+    unknown = [k for k in wanted if k not in GRAPHS]
+    if unknown:
+        raise KeyError(f"Unknown graph(s): {', '.join(unknown)}")
+    return [k for k in GRAPHS if k in wanted]
+
+
+def stages_for(keys):
+    """Names of the stage functions the given graphs need, in the order they would run."""
+    order = []
+
+    def visit(names):
+        for name in names:
+            s = STAGES[name]
+            visit(s.needs)
+            if s.func.__name__ not in order:
+                order.append(s.func.__name__)
+    for key in keys:
+        visit(GRAPHS[key].needs)
+    return order
+
+
+def resolve(names, data):
+    """Fill in `data` with the given names, running (depth first) only the stages still missing."""
+    for name in names:
+        if name in data:
+            continue
+        if name not in STAGES:
+            raise KeyError(f"No stage provides {name!r}")
+        s = STAGES[name]
+        resolve(s.needs, data)
+        with instrument.section(s.func.__name__, s.section):
+            result = s.func(*(data[n] for n in s.needs))
+        if len(s.provides) == 1:
+            result = (result,)
+        data.update(zip(s.provides, result))
+    return data
+
+
+_worker_data = None
+
+def _init_worker(data, setup, instrument_run):
+    global _worker_data
+    _worker_data = data
+    if setup is not None:
+        setup()
+    if instrument_run is not None:
+        instrument.drain()  # Records inherited from the parent process
+        instrument.enable(instrument_run)
+
+
+def _render_captured(g):
+    """(printed text, instrumentation records, figures written) of one graph rendered in a worker."""
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        _call(g, _worker_data)
+    return out.getvalue(), instrument.drain(), image_writer.drain()
+
+
+class _Tee(io.StringIO):
+    """Keeps a copy of everything printed while still streaming it to the console."""
+
+    def __init__(self, stream):
+        super().__init__()
+        self.stream = stream
+
+    def write(self, text):
+        self.stream.write(text)
+        return super().write(text)
+
+
+def render(keys, jobs=1, setup=None, data=None, cache=None):
+    """
+    Render the graphs in `keys` (report order). `setup` re-applies global
+    plotting state (rcParams) inside each worker process. With a RenderCache,
+    graphs whose inputs, code and PNGs are unchanged are skipped and their
+    recorded log output is printed instead.
+    """
+    data = {} if data is None else data
+    graphs = [GRAPHS[key] for key in keys]
+    needed = set(stages_for(keys))
+    for s in dict.fromkeys(STAGES.values()):  # Definition order
+        if s.upfront and s.func.__name__ in needed:
+            resolve(s.provides, data)
+
+    if jobs <= 1:
+        rendered = []
+        for g in graphs:
+            resolve(g.needs, data)  # The rest lazily, so their output lands where it always did
+            if cache is None:
+                _call(g, data)
+                continue
+            key = cache.key(g, data)
+            logged = cache.lookup(g, key)
+            if logged is not None:
+                print(logged, end='')
+                continue
+            tee = _Tee(sys.stdout)
+            with contextlib.redirect_stdout(tee):
+                _call(g, data)
+            rendered.append((g, key, tee.getvalue()))
+        image_writer.flush()  # The PNGs are written in the background - hash them once they're on disk
+        for g, key, text in rendered:
+            cache.record(g, key, text)
+        if cache is not None:
+            cache.save()
+        return data
+
+    stage_text = {}  # Printed by the stages each graph is the first to need - shown just before it
+    for g in graphs:
+        captured = io.StringIO()
+        with contextlib.redirect_stdout(captured):
+            resolve(g.needs, data)
+        stage_text[g.key] = captured.getvalue()
+    cache_keys = {g.key: cache.key(g, data) for g in graphs} if cache is not None else {}
+    logged = {g.key: cache.lookup(g, cache_keys[g.key]) for g in graphs} if cache is not None else {}
+    run = instrument.run_id() if instrument.enabled() else None
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(data, setup, run)) as pool:
+        futures = {g.key: pool.submit(_render_captured, g)
+                   for g in graphs if logged.get(g.key) is None}
+        for g in graphs:
+            print(stage_text[g.key], end='')
+            if g.key not in futures:
+                print(logged[g.key], end='')
+                continue
+            text, records, written = futures[g.key].result()
+            instrument.extend(records)
+            image_writer.extend(written)
+            print(text, end='')
+            if cache is not None:
+                cache.record(g, cache_keys[g.key], text)
+    if cache is not None:
+        cache.save()
+    return data
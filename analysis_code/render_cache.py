@@ -0,0 +1,292 @@
+"""
+Content-addressed render cache for the graph tasks.
+
+A graph's cache key is a SHA-256 over
+  - the data it receives (DataFrames, lists, dicts, fitted models ... hashed by
+    content; an object of one of our classes, e.g. GramFit, also by the code
+    of its module),
+  - its source code, plus the source/value of the helpers and constants it
+    refers to (colour tables, style functions, ...), followed recursively, and
+    the full source of every other module of ours those come from (and the
+    modules that one imports) - see source_fingerprint(),
+  - the content of the files it opens itself (@graph(..., reads=[...]), e.g.
+    GRAPH 2's parsed_condition_scores_v2.csv),
+  - the rendering environment (the versions of GRAPH_LIBRARIES, matplotlib's
+    rcParams, and the PNG compression level / companion formats image_writer
+    is set to).
+
+render_manifest.json (next to graphs_v3/ and graphs_v4/) records, per graph,
+the key, the SHA-256 of each PNG it wrote and the text it printed. When the
+key still matches and the PNGs on disk are the ones recorded, the graph is not
+rendered or saved again - its log output is just replayed.
+"""
+import ast
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sys
+import types
+from importlib import metadata
+from pathlib import Path
+
+import matplotlib
+import numpy as np
+import pandas as pd
+
+import image_writer
+
+MANIFEST_NAME = 'render_manifest.json'
+MANIFEST_VERSION = 1
+# Third-party code the graphs run (matplotlib draws, Pillow encodes, textblob/wordcloud do GRAPHS 27/28 ...)
+GRAPH_LIBRARIES = ('matplotlib', 'numpy', 'pandas', 'pyarrow', 'scipy', 'statsmodels', 'textblob', 'wordcloud',
+                   'pillow')
+HERE = Path(__file__).resolve().parent
+
+
+def _update(h, obj):
+    """Feed a stable, content-based encoding of obj into hash h."""
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        h.update(type(obj).__name__.encode())
+        names = obj.columns if isinstance(obj, pd.DataFrame) else [obj.name]
+        dtypes = obj.dtypes if isinstance(obj, pd.DataFrame) else [obj.dtype]
+        h.update(repr([(str(n), str(d)) for n, d in zip(names, dtypes)]).encode())
+        h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, np.ndarray):
+        h.update(f'ndarray{obj.dtype}{obj.shape}'.encode())
+        h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, dict):
+        h.update(b'dict')
+        for k, v in obj.items():
+            _update(h, k)
+            _update(h, v)
+    elif isinstance(obj, (list, tuple)):
+        h.update(type(obj).__name__.encode() + str(len(obj)).encode())
+        for v in obj:
+            _update(h, v)
+    elif hasattr(obj, 'model') and hasattr(obj, 'params'):
+        # Fitted statsmodels results: fully determined by the model's data
+        h.update(type(obj.model).__name__.encode())
+        _update(h, np.asarray(obj.model.endog))
+        _update(h, np.asarray(obj.model.exog))
+        _update(h, list(getattr(obj.model, 'exog_names', None) or []))
+    else:
+        path = _local_file(obj)
+        if path is not None:  # One of our classes (e.g. GramFit): its code decides what a graph reads off it
+            h.update(_code_digest(path).encode())
+        h.update(repr(obj).encode())
+    h.update(b'|')
+
+
+def data_fingerprint(obj):
+    h = hashlib.sha256()
+    _update(h, obj)
+    return h.hexdigest()
+
+
+def _code_names(code):
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _code_names(const)
+    return names
+
+
+def _local_file(obj):
+    """Source file of the module obj (a module, function, class or instance) comes from, if it's one of ours."""
+    if not isinstance(obj, (types.ModuleType, types.FunctionType, type)):
+        obj = type(obj)
+    try:
+        path = Path(inspect.getfile(obj)).resolve()
+    except TypeError:  # Built-in
+        return None
+    return path if path.parent == HERE else None
+
+
+@functools.lru_cache(maxsize=None)
+def _direct_imports(path):
+    """Our modules that path imports - at the top or inside a function."""
+    imported = set()
+    for node in ast.walk(ast.parse(path.read_text(encoding='utf-8'))):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and not node.level and node.module:
+            names = [node.module]
+        else:
+            continue
+        imported.update(HERE / f"{name.split('.')[0]}.py" for name in names)
+    return frozenset(p for p in imported if p.exists())
+
+
+def _imported_files(path):
+    """path plus every one of our modules it imports, directly or not."""
+    files, todo = set(), [path]
+    while todo:
+        p = todo.pop()
+        if p not in files:
+            files.add(p)
+            todo.extend(_direct_imports(p))
+    return files
+
+
+@functools.lru_cache(maxsize=None)
+def _code_digest(path):
+    """Hash of the source of path and of every module of ours it imports."""
+    h = hashlib.sha256()
+    for p in sorted(_imported_files(path)):
+        h.update(p.name.encode() + p.read_bytes())
+    return h.hexdigest()
+
+
+def source_fingerprint(func):
+    """
+    Hash of all the code func depends on. Functions and classes of its own module
+    are followed one by one (source, then the names they refer to, recursively),
+    so editing one graph doesn't invalidate the others. Anything that comes from
+    one of our other modules (bootstrap.py, keyword_matcher.py, ...) pulls in the
+    full source of that module and of every module of ours it imports. Constants
+    and objects with a repr (colour tables, a LikertEncoder's rules) are hashed by
+    value; third-party code by the GRAPH_LIBRARIES versions in environment_fingerprint().
+    """
+    h = hashlib.sha256()
+    own = _local_file(func)
+    visited, files = set(), set()
+
+    def visit(obj):
+        if id(obj) in visited:
+            return
+        visited.add(id(obj))
+        h.update(inspect.getsource(obj).encode())
+        if isinstance(obj, types.FunctionType):
+            names, namespace = _code_names(obj.__code__), obj.__globals__
+        else:
+            methods = [m for m in vars(obj).values() if isinstance(m, types.FunctionType)]
+            names = set().union(*(_code_names(m.__code__) for m in methods))
+            namespace = sys.modules[obj.__module__].__dict__
+        for name in sorted(names):
+            if name in namespace:
+                refer(name, namespace[name])
+
+    def refer(name, value):
+        path = _local_file(value)
+        if path == own and isinstance(value, (types.FunctionType, type)):
+            h.update(name.encode())
+            visit(value)
+            return
+        if path is not None and path != own:
+            files.update(_imported_files(path) - {own})
+        if isinstance(value, (types.FunctionType, type, types.ModuleType)):
+            return  # Code: covered above (ours) or by the environment (third-party)
+        if isinstance(value, (dict, list, tuple, str, int, float)) or type(value).__repr__ is not object.__repr__:
+            h.update(name.encode() + repr(value).encode())  # e.g. a LikertEncoder's rule table
+
+    visit(func)
+    for path in sorted(files):
+        h.update(path.name.encode() + path.read_bytes())
+    return h.hexdigest()
+
+
+def library_versions():
+    """Installed version of each library the graphs compute or draw with (None = not installed)."""
+    versions = {}
+    for name in GRAPH_LIBRARIES:
+        try:
+            versions[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            versions[name] = None
+    return versions
+
+
+def environment_fingerprint():
+    rc = sorted((k, repr(v)) for k, v in matplotlib.rcParams.items())
+    return hashlib.sha256(repr((library_versions(), rc, image_writer.output_settings())).encode()).hexdigest()
+
+
+def file_sha256(path):
+    with open(path, 'rb') as fh:
+        return hashlib.sha256(fh.read()).hexdigest()
+
+
+class RenderCache:
+    """The manifest plus per-run memo of data fingerprints (each stage output is hashed once)."""
+
+    def __init__(self, path=MANIFEST_NAME):
+        self.path = Path(path)
+        self.entries = {}
+        if self.path.exists():
+            try:
+                manifest = json.loads(self.path.read_text(encoding='utf-8'))
+                if manifest.get('version') == MANIFEST_VERSION:
+                    self.entries = manifest.get('graphs', {})
+            except (OSError, ValueError):
+                self.entries = {}  # Unreadable manifest = empty cache
+        self._data_fp = {}
+        self._env_fp = None
+
+    def key(self, g, data):
+        if self._env_fp is None:
+            self._env_fp = environment_fingerprint()
+        h = hashlib.sha256()
+        h.update(self._env_fp.encode())
+        h.update(source_fingerprint(g.func).encode())
+        h.update(repr(g.outputs).encode())
+        for path in g.reads:
+            h.update(path.encode() + (file_sha256(path) if os.path.exists(path) else 'missing').encode())
+        for name in g.needs:
+            if name not in self._data_fp:
+                self._data_fp[name] = data_fingerprint(data[name])
+            h.update(name.encode() + self._data_fp[name].encode())
+        return h.hexdigest()
+
+    def lookup(self, g, key):
+        """The recorded log text if g is up to date on disk, else None."""
+        entry = self.entries.get(g.key)
+        if not entry or entry.get('key') != key:
+            return None
+        for out in g.outputs:
+            recorded = entry.get('outputs', {}).get(out)
+            if recorded is None or not os.path.exists(out) or file_sha256(out) != recorded:
+                return None
+        return entry.get('stdout', '')
+
+    def record(self, g, key, stdout):
+        self.entries[g.key] = {
+            'key': key,
+            'outputs': {out: file_sha256(out) for out in g.outputs if os.path.exists(out)},
+            'stdout': stdout,
+        }
+
+    def save(self):
+        tmp = self.path.with_suffix('.tmp')
+        tmp.write_text(json.dumps({'version': MANIFEST_VERSION, 'graphs': self.entries},
+                                  indent=1, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp, self.path)
+
+
+if __name__ == '__main__':
+    # Self-check (run next to the workbook): editing a file a graph reads itself changes its key
+    #     python render_cache.py
+    import shutil
+    import tempfile
+
+    import all_pretty_graphs_v3 as script
+    from pipeline import GRAPHS, resolve
+
+    print(library_versions())
+    g = GRAPHS['2']
+    data = resolve(g.needs, {})
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        for path in g.reads:
+            shutil.copy(path, tmp)
+        os.chdir(tmp)
+        try:
+            before = RenderCache(MANIFEST_NAME).key(g, data)
+            assert RenderCache(MANIFEST_NAME).key(g, data) == before
+            with open(script.PARSED_SCORES_PATH, 'a', encoding='utf-8') as fh:
+                fh.write('0,Other,5\n')
+            assert RenderCache(MANIFEST_NAME).key(g, data) != before, 'editing the CSV must invalidate GRAPH 2'
+        finally:
+            os.chdir(cwd)
+    print(f"GRAPH 2 re-renders after {', '.join(g.reads)} changes")
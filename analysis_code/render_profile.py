@@ -0,0 +1,68 @@
+"""
+Render profiles: how the graphs' PNGs are written.
+
+    publish   today's output, byte for byte: each graph's own savefig arguments
+              (dpi=150, bbox_inches='tight'), into graphs_v3/ and graphs_v4/
+    draft     quick previews for styling work, into graphs_draft/graphs_v3/ ...
+              - DRAFT_DPI instead of 150
+              - no bbox_inches='tight' (that costs a second full draw just to
+                measure the bounding box; the graphs call tight_layout anyway)
+              - aggressive path simplification, no antialiasing
+
+Every graph saves through save_figure(path, **savefig_kwargs) instead of
+plt.savefig, so the profile is decided in one place. use() picks the profile
+(and applies its rcParams) - call it again in worker processes. The figure is
+then encoded and written in the background (image_writer.py).
+"""
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+
+from image_writer import write_figure
+
+DRAFT_DPI = 72
+DRAFT_DIR = 'graphs_draft'
+
+PROFILES = {
+    'publish': {'dpi': None, 'tight': True, 'directory': None, 'rc': {}},
+    'draft': {
+        'dpi': DRAFT_DPI, 'tight': False, 'directory': DRAFT_DIR,
+        'rc': {
+            'path.simplify': True, 'path.simplify_threshold': 1.0,
+            'lines.antialiased': False, 'patch.antialiased': False, 'text.antialiased': False,
+        },
+    },
+}
+
+_current = {'name': 'publish'}
+
+
+def use(name='publish'):
+    """Select a profile (KeyError for an unknown one) and apply its rcParams."""
+    plt.rcParams.update(PROFILES[name]['rc'])
+    _current['name'] = name
+
+
+def current():
+    return _current['name']
+
+
+def output_path(path):
+    """Where `path` (e.g. 'graphs_v3/03_x.png') is written under the current profile."""
+    directory = PROFILES[_current['name']]['directory']
+    return Path(directory) / path if directory else Path(path)
+
+
+def save_figure(path, **kwargs):
+    """plt.savefig(path, **kwargs), adjusted by the current profile (written asynchronously)."""
+    profile = PROFILES[_current['name']]
+    if profile['dpi'] is not None:
+        kwargs['dpi'] = profile['dpi']
+    if not profile['tight']:
+        kwargs.pop('bbox_inches', None)
+    target = output_path(path)
+    if profile['directory']:
+        target.parent.mkdir(parents=True, exist_ok=True)
+    else:
+        target = path  # Exactly what the graph asked for
+    write_figure(target, **kwargs)
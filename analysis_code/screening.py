@@ -0,0 +1,182 @@
+"""
+Declarative screening rules, compiled to vectorized masks.
+
+Screening used to be a hand-written chain of flag columns in the graph script,
+and the attention checks were re-implemented inline in the graphs
+(`'frequently' in att`). Here each piece is declared once:
+
+    AnswerCheck     one question (column position) and its right answers:
+                    exact `equals` answers and/or lowercase `contains` needles
+    Exemption       a row-level flag that rescues a response from a rule
+    ScreeningRule   exclude when ALL its checks fail (an unanswered question
+                    fails, or is skipped with skip_unanswered=True), unless
+                    the exemption holds
+
+SCREENING_RULES.flags(df) evaluates every check and exemption once and
+returns the flag columns the script has always written (passed_B, passed_C,
+wrong_both_BC, wrong_AQ, is_japanese, exclude), plus passed_AQ and
+`exclusion_reasons`: a bitfield with bit i set when rule i excluded the row.
+audit() turns those flags into a table of the excluded responses and why
+(`render --screening-audit` writes it to SCREENING_AUDIT).
+
+ATTENTION_CHECKS are the graph-level attention filters (features.py, GRAPH 26b):
+a substring match, where the wrong_AQ screening rule needs the exact answer.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+SCREENING_AUDIT = 'screening_audit.csv'
+
+# Hiragana, Katakana and CJK Unified Ideographs (non-raw string so the pattern holds the
+# actual characters - pyarrow's regex engine doesn't understand \u escapes)
+JAPANESE_RE = re.compile('[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FFF]')
+
+
+def has_japanese_mask(df):
+    """
+    Vectorized Japanese-text detector (replaces the row-wise has_japanese apply).
+    Runs ONE compiled regex over each text column and ORs the column masks,
+    so a row is flagged if ANY of its answers contains Japanese characters.
+    Numeric/datetime/bool columns can't hold kana or kanji, so they're skipped.
+    """
+    mask = pd.Series(False, index=df.index)
+    for col in df.columns:
+        s = df[col]
+        if not (s.dtype == object or pd.api.types.is_string_dtype(s.dtype)):
+            continue
+        values = s.dropna()
+        if len(values) == 0:
+            continue
+        # Pattern text, not the compiled object: Arrow-backed string columns only take strings
+        hits = values.astype(str).str.contains(JAPANESE_RE.pattern, regex=True)
+        mask |= hits.reindex(df.index, fill_value=False)
+    return mask
+
+
+class AnswerCheck:
+    """The answer at column position `column` is one of `equals` or contains one of `contains` (lowercased)."""
+
+    def __init__(self, name, column, equals=(), contains=()):
+        self.name = name
+        self.column = column
+        self.equals = tuple(equals)
+        self.contains = tuple(needle.lower() for needle in contains)
+
+    def __repr__(self):
+        return f'AnswerCheck({self.name!r}, {self.column}, equals={self.equals!r}, contains={self.contains!r})'
+
+    def answered(self, df):
+        return df.iloc[:, self.column].notna()
+
+    def passed(self, df):
+        """Boolean mask; unanswered never passes. Evaluated once per distinct answer."""
+        s = df.iloc[:, self.column]
+        distinct = s.cat.categories if isinstance(s.dtype, pd.CategoricalDtype) else pd.unique(s.dropna())
+        right = [v for v in distinct if v in self.equals or any(n in str(v).lower() for n in self.contains)]
+        return s.isin(right)
+
+
+class Exemption:
+    def __init__(self, name, mask):
+        self.name = name
+        self.mask = mask  # df -> boolean Series
+
+    def __repr__(self):
+        return f'Exemption({self.name!r}, {self.mask.__name__})'
+
+
+class ScreeningRule:
+    """Exclude a response that fails every one of `checks`, unless `exempt` holds for it."""
+
+    def __init__(self, name, checks, skip_unanswered=False, exempt=None, label=None):
+        self.name = name
+        self.checks = list(checks)
+        self.skip_unanswered = skip_unanswered  # Unanswered = not failed (else unanswered = failed)
+        self.exempt = exempt
+        self.label = label or name
+
+    def __repr__(self):
+        return (f'ScreeningRule({self.name!r}, {self.checks!r}, skip_unanswered={self.skip_unanswered}, '
+                f'exempt={self.exempt!r})')
+
+
+class ScreeningRules:
+    """An ordered rule set; rule i owns bit i of `exclusion_reasons`."""
+
+    def __init__(self, rules):
+        self.rules = list(rules)
+        if len(self.rules) > 8:
+            raise ValueError("exclusion_reasons is a uint8 bitfield - at most 8 rules")
+        self.checks = list({id(c): c for r in self.rules for c in r.checks}.values())
+        self.exemptions = list({id(r.exempt): r.exempt for r in self.rules if r.exempt}.values())
+
+    def __repr__(self):
+        return f'ScreeningRules({self.rules!r})'
+
+    def flags(self, df):
+        """Flag columns per response: passed_<check>, <rule> (failed), <exemption>, exclusion_reasons, exclude."""
+        flags = pd.DataFrame(index=df.index)
+        for check in self.checks:
+            flags[f'passed_{check.name}'] = check.passed(df)
+        for rule in self.rules:
+            failed = [~flags[f'passed_{c.name}'] & (c.answered(df) if rule.skip_unanswered else True)
+                      for c in rule.checks]
+            flags[rule.name] = np.logical_and.reduce(failed)
+        for exemption in self.exemptions:
+            flags[exemption.name] = exemption.mask(df)
+
+        reasons = np.zeros(len(df), dtype=np.uint8)
+        for bit, rule in enumerate(self.rules):
+            excluded = flags[rule.name] & ~flags[rule.exempt.name] if rule.exempt else flags[rule.name]
+            reasons |= excluded.to_numpy(bool).astype(np.uint8) << bit
+        flags['exclusion_reasons'] = reasons
+        flags['exclude'] = reasons != 0
+        return flags
+
+    def reasons(self, bits):
+        """Rule labels behind one exclusion_reasons value."""
+        return [rule.label for i, rule in enumerate(self.rules) if int(bits) >> i & 1]
+
+    def audit(self, frame):
+        """
+        One row per excluded response (frame = survey + flag columns, e.g. raw_df_unfiltered):
+        Timestamp, the reasons, and which checks it passed or was exempted by.
+        """
+        excluded = frame[frame['exclude']]
+        table = pd.DataFrame({
+            'timestamp': excluded.iloc[:, 0],
+            'reasons': ['; '.join(self.reasons(bits)) for bits in excluded['exclusion_reasons']],
+            'exclusion_reasons': excluded['exclusion_reasons'],
+        }, index=excluded.index)
+        for name in [f'passed_{c.name}' for c in self.checks] + [e.name for e in self.exemptions]:
+            table[name] = excluded[name]
+        table.index.name = 'row'
+        return table
+
+
+# ============================================================================
+# THE SCREENING (methodology exclusions)
+# ============================================================================
+CHECK_B = AnswerCheck('B', 1, equals=[
+    'Responds naturally without complex prompting, good at reading between the lines and understanding nuanced context'])
+# C: the right description, or "I have not used the GPT-5 series"
+CHECK_C = AnswerCheck('C', 2, equals=[
+    'Responses often end with follow-up questions, can automatically adjust thinking time'],
+    contains=['have not used'])
+# "select the option that starts with F": the screening wants exactly 'Frequently' (current users)
+CHECK_AQ = AnswerCheck('AQ', 42, equals=['Frequently'])
+# The graphs' own attention filters have always been the looser `'frequently' in answer`
+ATTENTION_CURRENT = AnswerCheck('attention_current', 42, contains=['frequently'])  # Current users
+ATTENTION_FORMER = AnswerCheck('attention_former', 20, contains=['frequently'])    # Former users
+
+JAPANESE = Exemption('is_japanese', has_japanese_mask)
+
+SCREENING_RULES = ScreeningRules([
+    ScreeningRule('wrong_both_BC', [CHECK_B, CHECK_C], label='Failed both B&C'),
+    # Current users AQ only (column 42) - per established methodology. Japanese responses are retained.
+    ScreeningRule('wrong_AQ', [CHECK_AQ], skip_unanswered=True, exempt=JAPANESE, label='Failed AQ (non-JP)'),
+])
+
+ATTENTION_CHECKS = {'current': ATTENTION_CURRENT, 'former': ATTENTION_FORMER}
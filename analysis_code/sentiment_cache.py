@@ -0,0 +1,89 @@
+"""
+Cached, batched sentiment scoring for the story graph (GRAPH 28).
+
+GRAPH 28 used to build a TextBlob for every story on every run, only to keep
+.sentiment.polarity. Here each story's polarity is stored in a SQLite table in
+.survey_cache/, keyed by a SHA-256 of the story text (and the TextBlob
+version, since a new lexicon can change the scores). A run only scores the
+stories it hasn't seen - in a process pool when there are enough of them -
+and reads every other polarity back from the table.
+
+bucket_counts() sorts polarities into the graph's five categories with
+np.digitize instead of five passes over the list.
+"""
+import contextlib
+import hashlib
+import multiprocessing
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from survey_cache import CACHE_DIR_NAME
+
+SENTIMENT_DB = 'sentiment.sqlite'
+BATCH = 256           # Stories per pool task
+MIN_PARALLEL = 1_000  # Fewer misses than this are scored inline (pool start-up costs more)
+
+# Category edges. Negative side is [low, high), positive side (low, high]:
+# < -0.3 | -0.3 .. < -0.1 | -0.1 .. 0.1 | > 0.1 .. 0.3 | > 0.3
+NEGATIVE_EDGES = [-0.3, -0.1]
+POSITIVE_EDGES = [0.1, 0.3]
+CATEGORIES = ['very_negative', 'negative', 'neutral', 'positive', 'very_positive']
+
+
+def _scorer_version():
+    from importlib.metadata import version
+    return f'textblob {version("textblob")}'
+
+
+def story_key(story, version):
+    return hashlib.sha256(f'{version}\0{story}'.encode()).hexdigest()
+
+
+def polarities(stories):
+    """TextBlob polarity (-1 negative .. +1 positive) of each story."""
+    from textblob import TextBlob
+    return [TextBlob(story).sentiment.polarity for story in stories]
+
+
+def score_misses(stories, workers=None):
+    """polarities(), in a process pool for big batches (same numbers either way)."""
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(stories) < MIN_PARALLEL or multiprocessing.parent_process() is not None:
+        return polarities(stories)
+    batches = [stories[i:i + BATCH] for i in range(0, len(stories), BATCH)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return [p for batch in pool.map(polarities, batches) for p in batch]
+
+
+def cached_polarities(stories, cache_dir=CACHE_DIR_NAME, workers=None):
+    """Polarity per story (same order), scoring only stories not in the cache yet."""
+    stories = [str(s) for s in stories]
+    version = _scorer_version()
+    keys = [story_key(s, version) for s in stories]
+    path = Path(cache_dir) / SENTIMENT_DB
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with contextlib.closing(sqlite3.connect(path)) as db, db:  # Commit, then close
+        db.execute('CREATE TABLE IF NOT EXISTS polarity (story_hash TEXT PRIMARY KEY, polarity REAL NOT NULL)')
+        known = {}
+        unique = list(dict.fromkeys(keys))
+        for start in range(0, len(unique), 500):  # Stay under SQLite's bound-parameter limit
+            chunk = unique[start:start + 500]
+            known.update(db.execute(f"SELECT story_hash, polarity FROM polarity WHERE story_hash IN "
+                                    f"({','.join('?' * len(chunk))})", chunk))
+        missing = {k: s for k, s in zip(keys, stories) if k not in known}
+        if missing:
+            scores = score_misses(list(missing.values()), workers)
+            known.update(zip(missing, scores))
+            db.executemany('INSERT OR REPLACE INTO polarity VALUES (?, ?)', zip(missing, scores))
+    return [known[k] for k in keys]
+
+
+def bucket_counts(values):
+    """{category: count} over CATEGORIES, from one np.digitize per side of zero."""
+    values = np.asarray(values, dtype=float)
+    bucket = np.digitize(values, NEGATIVE_EDGES) + np.digitize(values, POSITIVE_EDGES, right=True)
+    return dict(zip(CATEGORIES, np.bincount(bucket, minlength=len(CATEGORIES)).tolist()))
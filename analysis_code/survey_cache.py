@@ -0,0 +1,115 @@
+"""
+Columnar ingestion cache for the survey workbook.
+
+Parsing the .xlsx through openpyxl dominates startup once a response wave gets
+large, so the workbook is converted ONCE into an uncompressed Arrow (Feather v2)
+file and later runs memory-map that file instead of re-parsing.
+
+The cache file is keyed by the SHA-256 of the workbook bytes, so editing or
+replacing the workbook automatically triggers a fresh parse. Cache files live in
+a `.survey_cache/` folder next to the workbook.
+"""
+import datetime
+import hashlib
+import os
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # No pyarrow -> always parse the workbook directly
+    pa = None
+    feather = None
+
+CACHE_DIR_NAME = '.survey_cache'
+
+
+def file_digest(path, chunk_size=1 << 20):
+    """SHA-256 of a file's contents (streamed, so big exports are fine)."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def cache_path_for(path, digest):
+    path = Path(path)
+    return path.parent / CACHE_DIR_NAME / f'{path.stem}-{digest[:16]}.arrow'
+
+
+def to_columnar(df):
+    """
+    Give every column a single Arrow-friendly type.
+
+    Columns that are all numbers / all datetimes become numeric / datetime.
+    Object columns that MIX strings and numbers (e.g. someone typed "7" into a
+    free-text box) are stored as strings - every consumer in the analysis
+    reads those cells through str() anyway, so nothing downstream changes.
+    """
+    typed = {}
+    for col in df.columns:
+        s = df[col]
+        if s.dtype != object:
+            typed[col] = s
+            continue
+        values = s.dropna()
+        kinds = {type(v) for v in values}
+        if not kinds or kinds <= {str}:
+            typed[col] = s
+        elif all(issubclass(k, (int, float)) and not issubclass(k, bool) for k in kinds):
+            typed[col] = pd.to_numeric(s)
+        elif all(issubclass(k, datetime.datetime) for k in kinds):
+            typed[col] = pd.to_datetime(s)
+        else:
+            typed[col] = s.where(s.isna(), s.astype(str))
+    return pd.DataFrame(typed, columns=df.columns)
+
+
+def _cacheable(df):
+    return (all(isinstance(c, str) for c in df.columns)
+            and df.columns.is_unique
+            and isinstance(df.index, pd.RangeIndex))
+
+
+def write_cache(df, cache_path):
+    cache_path = Path(cache_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    table = pa.Table.from_pandas(to_columnar(df), preserve_index=False)
+    tmp_path = cache_path.with_suffix('.tmp')
+    feather.write_feather(table, tmp_path, compression='uncompressed')
+    os.replace(tmp_path, cache_path)  # Atomic - a crashed run never leaves half a cache
+    # Drop caches for older versions of the same workbook
+    for stale in cache_path.parent.glob(f"{cache_path.stem.rsplit('-', 1)[0]}-*.arrow"):
+        if stale != cache_path:
+            stale.unlink()
+
+
+def read_cache(cache_path):
+    """Memory-map the Arrow file and hand back a DataFrame."""
+    with pa.memory_map(str(cache_path), 'r') as source:
+        table = pa.ipc.open_file(source).read_all()
+    return table.to_pandas()
+
+
+def load_survey(path, use_cache=True):
+    """
+    Drop-in replacement for pd.read_excel(path) that serves repeat runs from
+    the columnar cache. Falls back to a plain read_excel when pyarrow is not
+    installed or the frame can't be stored as Arrow.
+    """
+    if not use_cache or pa is None:
+        return pd.read_excel(path)
+
+    cache_path = cache_path_for(path, file_digest(path))
+    if cache_path.exists():
+        return read_cache(cache_path)
+
+    df = pd.read_excel(path)
+    if _cacheable(df):
+        write_cache(df, cache_path)
+        print(f"Cached {Path(path).name} -> {cache_path}")
+        return read_cache(cache_path)  # Same typed frame the next run will see
+    return df
@@ -0,0 +1,142 @@
+"""
+Compact dtypes for the response frame.
+
+Almost every column the graphs read is a Likert answer or a multiple-choice
+string, repeated hundreds of times. As plain strings every cell is its own
+Python/Arrow string; as a pandas Categorical a column is one small integer
+code per row plus a lookup table of its distinct answers.
+
+SURVEY_SCHEMA lists those columns by position (same numbering as
+raw_df.columns[N] in the graph script). The screening flags are plain numpy
+bool (one byte per row), never object or nullable booleans.
+
+Categories are kept in order of FIRST APPEARANCE, so value_counts() breaks
+ties exactly like it does for strings. After selecting rows, refit() drops the
+answers that no longer occur, so value_counts() doesn't grow zero rows.
+
+    python survey_schema.py [survey.xlsx | export.csv | export.parquet] [--scale N]
+
+prints the memory before/after for a dataset (rows repeated N times), then
+checks that compacting it in chunks (--chunksize) gives the whole-frame result.
+"""
+import numpy as np
+import pandas as pd
+
+# Position -> what the graphs do with it
+SURVEY_SCHEMA = {
+    1: 'attention check B', 2: 'attention check C', 3: 'age', 4: 'gender', 5: 'country',
+    6: 'source', 7: 'branch', 8: 'former-user conditions', 10: 'former-user scale',
+    13: 'former-user primary uses', 16: 'routing factor', 17: 'routing R', 18: 'routing S',
+    19: 'other reasons for leaving', 20: 'former-user attention check', 24: 'ASD',
+    25: 'cognitive bridge', 26: 'ways 4o helps', 27: 'impacts if unavailable',
+    28: 'current-user conditions', 29: 'uses 4o for condition', 30: 'current-user scale',
+    32: 'tried other models', 33: 'models tried', 34: 'hours', 35: 'interaction mode',
+    36: 'voice importance', 37: 'voice importance (scale)', 41: 'experienced since Aug 7',
+    42: 'current-user attention check', 43: 'impact of losing access', 48: 'routing occurred',
+    49: 'routing experience', 50: 'switching concern', 51: 'avoided/abandoned',
+    52: 'reason for using 4o', 71: 'trust', 72: 'needs valued', 76: 'eulogy reaction',
+    77: 'long-term needs',
+}
+
+
+def _first_seen_categorical(s):
+    values = s.to_numpy(dtype=object, na_value=None)
+    categories = pd.unique(s.dropna().to_numpy(dtype=object))
+    return pd.Series(pd.Categorical(values, categories=categories), index=s.index, name=s.name)
+
+
+def compact(df, schema=SURVEY_SCHEMA):
+    """df with the schema's (text) columns as Categoricals; other columns untouched."""
+    df = df.copy(deep=False)
+    for pos in schema:
+        if pos >= len(df.columns):
+            continue
+        s = df.iloc[:, pos]
+        if s.dtype == object or pd.api.types.is_string_dtype(s.dtype):
+            df.isetitem(pos, _first_seen_categorical(s))
+    return df
+
+
+def refit(df):
+    """After selecting rows: drop unused answers, re-order categories by first appearance."""
+    df = df.copy(deep=False)
+    for pos in range(len(df.columns)):
+        s = df.iloc[:, pos]
+        if isinstance(s.dtype, pd.CategoricalDtype) and len(s.cat.categories):
+            df.isetitem(pos, s.cat.set_categories(pd.unique(s.dropna().to_numpy(dtype=object))))
+    return df
+
+
+def _with_categories_dtype(s, dtype):
+    """Categorical s with its categories stored as `dtype` (same codes, same answers)."""
+    if s.cat.categories.dtype == dtype:
+        return s
+    return pd.Series(pd.Categorical.from_codes(s.cat.codes, s.cat.categories.astype(dtype)),
+                     index=s.index, name=s.name)
+
+
+def concat_compact(parts):
+    """pd.concat for chunks compacted separately: categorical columns stay categorical."""
+    frame = pd.concat(parts)
+    for pos in range(len(frame.columns)):
+        column = [p.iloc[:, pos] for p in parts]
+        is_cat = [isinstance(c.dtype, pd.CategoricalDtype) for c in column]
+        if any(is_cat) and not all(is_cat):
+            # A part where the column was all-missing wasn't compacted - it holds no answers to add
+            if not all(cat or c.isna().all() for cat, c in zip(is_cat, column)):
+                continue
+            empty = pd.CategoricalDtype(column[is_cat.index(True)].cat.categories[:0])
+            column = [c if cat else c.astype(empty) for cat, c in zip(is_cat, column)]
+        if all(isinstance(c.dtype, pd.CategoricalDtype) for c in column):
+            # A part with no answers in this column has (empty) object categories, the others str -
+            # union_categoricals wants one categories dtype
+            dtypes = {c.cat.categories.dtype for c in column if len(c.cat.categories)}
+            common = dtypes.pop() if len(dtypes) == 1 else np.dtype(object)
+            merged = pd.api.types.union_categoricals([_with_categories_dtype(c, common).array for c in column])
+            frame.isetitem(pos, pd.Series(merged, index=frame.index, name=frame.columns[pos]))
+    return frame
+
+
+def frame_memory(df):
+    """Bytes held by df, strings included."""
+    return int(df.memory_usage(deep=True, index=True).sum())
+
+
+def memory_report(before, after, label='raw_df'):
+    b, a = frame_memory(before), frame_memory(after)
+    rows = max(len(before), 1)
+    print(f"{label}: {len(before):,} rows x {len(before.columns)} columns")
+    print(f"  before: {b / 2**20:9.2f} MiB  ({b / rows:,.0f} B/respondent)")
+    print(f"  after:  {a / 2**20:9.2f} MiB  ({a / rows:,.0f} B/respondent, {b / max(a, 1):.1f}x smaller)")
+
+
+if __name__ == '__main__':
+    import argparse
+    from pathlib import Path
+
+    from survey_cache import load_survey
+
+    parser = argparse.ArgumentParser(description='Memory of the survey frame before/after compact().')
+    parser.add_argument('path', nargs='?', default='survey (Responses) (version 3).xlsx')
+    parser.add_argument('--scale', type=int, default=1, help='repeat the rows N times')
+    parser.add_argument('--chunksize', type=int, default=50, help='chunk size for the chunked-vs-whole check')
+    args = parser.parse_args()
+
+    suffix = Path(args.path).suffix.lower()
+    if suffix == '.csv':
+        df = pd.read_csv(args.path, dtype=str, parse_dates=[0])
+    elif suffix in ('.parquet', '.pq'):
+        df = pd.read_parquet(args.path)
+    else:
+        df = load_survey(args.path)
+    if args.scale > 1:
+        df = df.iloc[np.tile(np.arange(len(df)), args.scale)].reset_index(drop=True)
+    memory_report(df, compact(df), label=Path(args.path).name)
+
+    # Self-check: compacting chunk by chunk + concat_compact() == compacting the whole frame,
+    # including a chunk where a column has no answers at all (the last schema column, first chunk)
+    check = df.copy()
+    check.iloc[:args.chunksize, max(SURVEY_SCHEMA)] = None
+    parts = [compact(check.iloc[i:i + args.chunksize]) for i in range(0, len(check), args.chunksize)]
+    pd.testing.assert_frame_equal(concat_compact(parts), compact(check))
+    print(f"concat_compact() of {len(parts)} chunks of {args.chunksize} == compact() of the whole frame")
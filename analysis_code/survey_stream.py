@@ -0,0 +1,103 @@
+"""
+Streaming (chunked) ingestion for large CSV / Parquet response exports.
+
+The workbook path loads every response into raw_df_unfiltered and then copies
+the survivors into raw_df, so peak memory is roughly twice the export. Here
+the export is read in row chunks instead, and each chunk is screened on its
+own (B/C/AQ checks + Japanese retention - same rules as the workbook path):
+
+  - rows that pass are compacted (survey_schema.compact) and keep every
+    column position the graphs index by (raw_df.columns[N] still means
+    question N), except free-text columns nobody is going to read: those
+    become an empty placeholder column (1 byte per row) unless a text graph
+    (GRAPH 27/28) was selected;
+  - rows that fail are only kept as far as FIGURE 1 needs them
+    (the demographic columns 0-6 + screening flags).
+
+Only the kept chunks and the demographic slice (which carries the flags the
+SCREENING counts come from) are held, so the full export never has to fit
+in memory at once.
+"""
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from survey_schema import compact, concat_compact
+
+DEFAULT_CHUNKSIZE = 50_000
+DEMOGRAPHIC_COLUMNS = 7  # Timestamp, B, C, age, gender, country, source
+
+
+class SurveySource:
+    """Where the survey comes from and how to read it (the 'survey_source' stage output)."""
+
+    def __init__(self, path, chunksize=None, text_columns=()):
+        self.path = path
+        self.chunksize = chunksize    # None = load the whole file at once (workbook path)
+        self.text_columns = list(text_columns)  # Free-text positions to keep when streaming
+
+    @property
+    def streaming(self):
+        return self.chunksize is not None
+
+    def __repr__(self):
+        mode = f'chunks of {self.chunksize}' if self.streaming else 'whole file'
+        return f'SurveySource({self.path!r}, {mode})'
+
+
+def iter_chunks(path, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    DataFrames of at most `chunksize` rows, with one running RangeIndex across chunks.
+    CSV cells are read as text (like the workbook answers); Parquet keeps its schema.
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix == '.csv':
+        yield from pd.read_csv(path, chunksize=chunksize, dtype=str, parse_dates=[0])
+    elif suffix in ('.parquet', '.pq'):
+        import pyarrow.parquet as pq
+        start = 0
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            chunk = batch.to_pandas()
+            chunk.index = pd.RangeIndex(start, start + len(chunk))
+            start += len(chunk)
+            yield chunk
+    else:
+        raise ValueError(f"Streaming ingestion reads .csv or .parquet exports, not {path!r}")
+
+
+def _placeholder(index):
+    """All-missing column that costs one byte per row."""
+    codes = np.full(len(index), -1, dtype=np.int8)
+    return pd.Series(pd.Categorical.from_codes(codes, categories=[]), index=index)
+
+
+def screen_chunk(chunk, screen, drop):
+    """(demographics + flags of every row, compacted rows that pass with `drop` positions blanked)."""
+    flags = screen(chunk)
+    unfiltered = compact(pd.concat([chunk.iloc[:, :DEMOGRAPHIC_COLUMNS], flags], axis=1))
+    kept = compact(pd.concat([chunk, flags], axis=1)[~flags['exclude']])
+    for pos in drop:
+        kept.isetitem(pos, _placeholder(kept.index))
+    return unfiltered, kept
+
+
+def stream_screened(source, screen, drop_columns):
+    """
+    Read source.path chunk by chunk and screen each chunk.
+
+    screen(chunk) -> DataFrame of flag columns (its 'exclude' column decides).
+    drop_columns: free-text positions to blank out unless source.text_columns keeps them.
+    Returns (unfiltered demographics + flags, screened responses + flags).
+    """
+    drop = [pos for pos in drop_columns if pos not in source.text_columns]
+    unfiltered_parts, kept_parts = [], []
+    for chunk in iter_chunks(source.path, source.chunksize):
+        unfiltered, kept = screen_chunk(chunk, screen, drop)
+        unfiltered_parts.append(unfiltered)
+        kept_parts.append(kept)
+        del chunk, kept  # Only the reduced parts survive the next read
+
+    if not kept_parts:
+        raise ValueError(f"{source.path} has no responses")
+    return concat_compact(unfiltered_parts), concat_compact(kept_parts)
@@ -0,0 +1,334 @@
+"""
+Synthetic survey responses for benchmarking.
+
+The real workbook only has ~659 rows, too few to see how the script scales.
+generate(n, seed) builds n fake responses with the same 82-column layout (the
+question headers come from ../Survey Questions.xlsx) and the same answer
+vocabularies: the attention-check strings, the col_7 branch strings, the Likert
+scales, multi-select answers joined with ', ', condition text mixing checkbox
+labels, write-ins and keyword near-misses, and col_78 stories. Each branch
+only answers its own questions, like the real form.
+
+Nothing here comes from real responses - it's vocabulary, not data.
+
+    python synthetic_survey.py out.parquet --rows 65900 [--seed 0]
+
+writes .xlsx, .csv or .parquet by the file suffix.
+"""
+from itertools import permutations
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+QUESTIONS_PATH = Path(__file__).resolve().parent.parent / 'Survey Questions.xlsx'
+N_COLUMNS = 82
+REAL_ROWS = 659  # Size of the real workbook - benchmark scales are multiples of this
+
+CORRECT_B = 'Responds naturally without complex prompting, good at reading between the lines and understanding nuanced context'
+WRONG_B = ['Fast and rigorous, prefers brief responses, exceptional at mathematics',
+           'Shows visible thinking process with adjustable thinking time', 'I have not used GPT-4o']
+CORRECT_C = 'Responses often end with follow-up questions, can automatically adjust thinking time'
+WRONG_C = ['Text-only interactions, provides detailed responses, cannot assist with image generation',
+           'Good at creative writing, coding capabilities are insufficient']
+NOT_USED_C = 'I have not used the GPT-5 series'
+
+AGES = ['Under 18', '18-24', '25-34', '35-44', '45-54', '55-64', '65 or older', 'Prefer not to say']
+GENDERS = ['Female', 'Male', 'Non-binary', 'Prefer not to say', 'agender', 'walmart shopping bag']
+COUNTRIES = ['Reside in the United States', 'Work for a U.S. company or organization',
+             'Primarily provide services to U.S. clients', 'None of the above']
+SOURCES = ['Social media post (Twitter/X, Reddit, etc.)', 'Direct message/email from community',
+           'Shared by a friend or community member', 'a discord server']
+BRANCHES = ['I currently use ChatGPT, primarily GPT-4o',
+            'I have stopped using ChatGPT; GPT-4o was my primary model before leaving',
+            'I currently use ChatGPT, primarily GPT-5/5.1 series',
+            'I currently use ChatGPT, primarily other models',
+            'I have stopped using ChatGPT; I primarily used other models before leaving']
+
+# Condition question (col_8 former users / col_28 current users)
+CONDITIONS = ['Autism Spectrum Disorder (ASD)', 'Attention-Deficit/Hyperactivity Disorder (ADHD)',
+              'Auditory Processing Disorder', 'Visual Impairment', 'Motor/Mobility Impairment',
+              'Learning Disability', 'Anxiety', 'Depression', 'Obsessive-Compulsive Disorder (OCD)',
+              'Dissociative Disorders', 'Post-Traumatic Stress Disorder (PTSD)', 'Chronic Illness/Pain']
+# Write-ins: most hit a MASTER_CONDITION_KEYWORDS entry, some only by substring accident
+# ('add' in 'address'), some hit nothing at all
+OTHER_CONDITIONS = ['Bipolar II', 'BPD', 'C-PTSD', 'fibromyalgia', 'lupus', 'PCOS', 'insomnia', 'AuDHD',
+                    'gender dysphoria', 'prosopagnosia', 'AvPD', 'neurodivergent', 'eating disorder',
+                    'rare genetic condition', 'DID', 'dyslexia', 'heart condition', 'speech delay',
+                    'my address is private', 'long covid', 'EDS', 'migraines', 'selective mutism']
+NO_CONDITIONS = 'I do not have any of these conditions'
+
+FORMER_SCALE = ['Did not assist / Not applicable', '1 - Provided minimal assistance',
+                '2 - Provided moderate assistance', '3 - Provided significant assistance',
+                '4 - Essential - I critically depended on it', 'Prefer not to say']
+CURRENT_SCALE = ['1 - Minimal assistance', '2 - Moderate assistance', '3 - Significant assistance',
+                 '4 - Essential - I critically depend on it', 'Prefer not to say']
+USE_ACC = ['Yes', 'No, I have condition(s) but use 4o for other purposes', "I don't have any conditions"]
+ATTENTION = ['Never', 'Rarely', 'Occasionally', 'Frequently', 'Always']
+HOURS = ['Less than 30 minutes per day', '30 minutes - 1 hour', '1-2 hours', '2-4 hours', '4-6 hours',
+         'More than 6 hours']
+IMPACT = ['No significant impact', 'Minimal disruption - minor adjustments needed',
+          'Moderate disruption - would require significant adjustment',
+          'Severe disruption - would fundamentally impair my current functioning',
+          'Catastrophic - would cause a crisis in my ability to function']
+
+# col_78 stories are drawn from this vocabulary (positive, negative and neutral words,
+# so the sentiment graph gets all three buckets)
+STORY_WORDS = ('helped me organize my day and calm my anxiety when I felt overwhelmed '
+               'it understood my autistic communication and made work possible again '
+               'losing it was devastating I cried and felt abandoned terrible awful '
+               'wonderful support amazing friend patient kind structure routine').split()
+JAPANESE_STORY = 'GPT-4oは私の生活を支えてくれました'
+
+
+def headers(path=QUESTIONS_PATH):
+    """The 82 column names: 'Timestamp' + question text, duplicates suffixed .1, .2 like pandas."""
+    if path.exists():
+        row = pd.read_excel(path, header=None).iloc[0].tolist()
+        names = ['Timestamp'] + [str(h) for h in row[1:N_COLUMNS]]
+    else:
+        names = ['Timestamp'] + [f'Question {i}' for i in range(1, N_COLUMNS)]
+    seen = {}
+    unique = []
+    for name in names:
+        if name in seen:
+            seen[name] += 1
+            unique.append(f'{name}.{seen[name]}')
+        else:
+            seen[name] = 0
+            unique.append(name)
+    return unique
+
+
+def pick(rng, options, n, p=None):
+    """n single-choice answers."""
+    return np.asarray(options, dtype=object)[rng.choice(len(options), size=n, p=p)]
+
+
+def multi(rng, options, n, k_max=3, extra=None, extra_p=0.15):
+    """
+    n multi-select answers: 1..k_max distinct options in random order, joined with ', '
+    (like the form export), sometimes followed by a write-in from `extra`.
+    Every ordered selection is a row of a small table, so this is one draw per answer.
+    """
+    k = rng.integers(1, k_max + 1, size=n)
+    out = np.empty(n, dtype=object)
+    for size in range(1, k_max + 1):
+        rows = np.flatnonzero(k == size)
+        table = np.asarray([', '.join(c) for c in permutations(options, size)], dtype=object)
+        out[rows] = table[rng.integers(len(table), size=len(rows))]
+    if extra is not None:
+        extras = np.flatnonzero(rng.random(n) < extra_p)
+        out[extras] = out[extras] + ', ' + pick(rng, extra, len(extras))
+    return out
+
+
+def stories(rng, n):
+    """n free-text stories of 8-40 words."""
+    lengths = rng.integers(8, 41, size=n)
+    words = pick(rng, STORY_WORDS, int(lengths.sum()))
+    ends = np.cumsum(lengths)
+    return np.asarray([' '.join(words[e - l:e]) for e, l in zip(ends, lengths)], dtype=object)
+
+
+def condition_text(rng, n):
+    """Condition answers: checkbox mixes, write-ins, 'none', 'prefer not' and contradictory ones."""
+    text = multi(rng, CONDITIONS, n, extra=OTHER_CONDITIONS, extra_p=0.3)
+    u = rng.random(n)
+    text[u < 0.25] = NO_CONDITIONS
+    text[(u >= 0.25) & (u < 0.29)] = 'Prefer not to say'
+    contradictory = np.flatnonzero((u >= 0.29) & (u < 0.32))  # Conditions AND "do not have any"
+    text[contradictory] = text[contradictory] + ', ' + NO_CONDITIONS
+    return text
+
+
+def generate(n=REAL_ROWS, seed=0, start=pd.Timestamp('2025-11-01')):
+    """n synthetic responses in the workbook's column layout, submitted over 40 days from `start`."""
+    rng = np.random.default_rng(seed)
+    cols = headers()
+    data = {c: np.full(n, np.nan, dtype=object) for c in cols}
+
+    def col(i):
+        return data[cols[i]]
+
+    data[cols[0]] = start + pd.to_timedelta(np.sort(rng.integers(0, 40 * 86400, n)), unit='s')
+    data[cols[1]] = np.where(rng.random(n) < 0.9, CORRECT_B, pick(rng, WRONG_B, n))
+    data[cols[2]] = np.where(rng.random(n) < 0.7, CORRECT_C,
+                             np.where(rng.random(n) < 0.6, NOT_USED_C, pick(rng, WRONG_C, n)))
+    data[cols[3]] = pick(rng, AGES, n, p=[.02, .2, .35, .25, .1, .04, .01, .03])
+    data[cols[4]] = pick(rng, GENDERS, n, p=[.6, .2, .12, .06, .01, .01])
+    data[cols[5]] = pick(rng, COUNTRIES, n, p=[.4, .05, .05, .5])
+    data[cols[6]] = pick(rng, SOURCES, n, p=[.7, .1, .15, .05])
+    branch = rng.choice(len(BRANCHES), size=n, p=[.55, .15, .15, .1, .05])
+    data[cols[7]] = np.asarray(BRANCHES, dtype=object)[branch]
+
+    current = np.flatnonzero(branch == 0)
+    former = np.flatnonzero(branch == 1)
+    gpt5 = np.flatnonzero(branch == 2)
+
+    # Former GPT-4o users
+    m = len(former)
+    col(8)[former] = condition_text(rng, m)
+    col(10)[former] = pick(rng, FORMER_SCALE, m, p=[.1, .1, .2, .25, .3, .05])
+    col(13)[former] = multi(rng, ['Work/professional tasks', 'Study/learning', 'Daily assistance',
+                                  'Accessibility support (e.g., managing a disability or condition)'], m)
+    col(16)[former] = pick(rng, ['Routing was not a factor / I left before routing was introduced',
+                                 'Routing was a factor, but not the primary reason',
+                                 'Routing was the primary reason I left'], m)
+    col(17)[former] = pick(rng, ["Minimal disruption - noticed but didn't significantly affect use",
+                                 'Minor disruption - annoying but manageable',
+                                 'Significant disruption - substantially interfered with use',
+                                 'Severe disruption - made the tool largely unusable',
+                                 'Critical disruption - became intolerable, directly caused me to leave'], m)
+    col(18)[former] = pick(rng, ['No significant impact', 'Yes, minor negative impacts',
+                                 'Yes, moderate negative impacts', 'Yes, severe negative impacts'], m)
+    col(19)[former] = multi(rng, ["Lost trust in the platform's stability",
+                                  "Frustration with OpenAI's decisions and communication",
+                                  'New guardrails/restrictions made my use case too difficult',
+                                  'Found a different AI tool that works better for my needs'], m)
+    col(20)[former] = pick(rng, ATTENTION, m, p=[.02, .02, .03, .9, .03])
+
+    # Current GPT-4o users
+    m = len(current)
+    asd = pick(rng, ['Yes', 'No', 'Prefer not to say'], m, p=[.3, .65, .05])
+    col(24)[current] = asd
+    autistic = current[asd == 'Yes']
+    col(25)[autistic] = pick(rng, ['Yes, I depend on these patterns for essential functions',
+                                   'Yes, these patterns significantly improve my functioning',
+                                   "No, this doesn't describe my experience", "I'm not sure"], len(autistic))
+    col(26)[autistic] = multi(rng, ['Provides a space where I can communicate naturally without needing to "translate" my thoughts',
+                                    'Understands my literal or detail-oriented communication style without judgment',
+                                    'Maintains predictable interaction patterns, thereby reducing my cognitive load',
+                                    'Allows me to unmask and process information in my most authentic way'], len(autistic))
+    col(27)[autistic] = multi(rng, ['Would have to resume exhausting masking or self-translation work',
+                                    'Would lose essential routines and coping mechanisms I rely on',
+                                    'Would reduce my ability to prepare for social interactions',
+                                    'Would experience more frequent or intense sensory or cognitive overload episodes'], len(autistic))
+    col(28)[current] = condition_text(rng, m)
+    use_acc = pick(rng, USE_ACC, m, p=[.7, .15, .15])
+    col(29)[current] = use_acc
+    on_scale = current[use_acc == 'Yes']
+    col(30)[on_scale] = pick(rng, CURRENT_SCALE, len(on_scale), p=[.1, .2, .3, .35, .05])
+    col(32)[current] = pick(rng, ['No, I have not tried',
+                                  'Yes, but they cannot adequately replace GPT-4o for these needs',
+                                  'Yes, they can adequately replace GPT-4o for these needs'], m)
+    col(33)[current] = multi(rng, ['Gemini', 'Claude', 'Grok', 'GPT-4.1', 'GPT-5', 'Mistral', 'Llama', 'pi'], m)
+    col(34)[current] = pick(rng, HOURS, m)
+    mode = pick(rng, ['Mainly through text', 'Mainly through voice', 'Mix of both'], m)
+    col(35)[current] = mode
+    voice = current[mode != 'Mainly through text']
+    col(36)[voice] = multi(rng, ['Motor or visual limitations make text difficult',
+                                 'The consistent pacing helps with auditory/cognitive processing',
+                                 'Cognitive processing needs make voice interaction essential',
+                                 'Personal preference (not accessibility-related)'], len(voice))
+    col(37)[voice] = pick(rng, ['Critical - other models cannot provide equivalent support',
+                                'Very important - other models would be significantly less effective',
+                                'Somewhat important - adapting to other models would be challenging but might be possible with significant effort'],
+                          len(voice))
+    # Wellbeing 1-10 before / during / after access
+    before = rng.integers(1, 8, m)
+    during = np.clip(before + rng.integers(0, 6, m), 1, 10)
+    after = np.clip(during - rng.integers(0, 7, m), 1, 10)
+    col(38)[current] = before
+    col(39)[current] = during
+    col(40)[current] = after
+    col(41)[current] = multi(rng, ['Delayed or abandoned important projects due to uncertainty',
+                                   'Experienced obstruction in study, work, or social tasks',
+                                   'Spent additional time or money seeking alternatives',
+                                   "Lost trust in the platform's long-term reliability", 'None of the above'], m)
+    col(42)[current] = pick(rng, ATTENTION, m, p=[.02, .02, .02, .92, .02])
+    col(43)[current] = pick(rng, IMPACT, m, p=[.05, .1, .25, .35, .25])
+    col(48)[current] = multi(rng, ['While handling study or work tasks', 'When seeking advice or support',
+                                   'When sharing personal life experiences or feelings', 'During creative writing'], m)
+    col(49)[current] = multi(rng, ['It disrupts my workflow or train of thought',
+                                   'It makes me feel my choices are not respected',
+                                   'It reduces my trust in the platform',
+                                   'It increases my anxiety or uncertainty'], m)
+    col(50)[current] = multi(rng, ['Began avoiding discussion of personal or difficult topics',
+                                   'Felt the need to self-censor, compelled to share only "safe" content',
+                                   'Overall reduced reliance on and frequency of using the tool'], m)
+    col(51)[current] = pick(rng, ['Yes, this made me feel I lost necessary support at a critical moment',
+                                  'Yes, but I found other alternatives',
+                                  'I had this concern, but still used it with hesitation and reservations',
+                                  'No, this has not occurred'], m)
+    col(76)[current] = pick(rng, ['Positive - Creative or meaningful demonstration',
+                                  'Neutral - Standard marketing with no particular significance',
+                                  'Mixed feelings - Had both positive and concerning aspects',
+                                  'Uncomfortable - Seemed inappropriate or insensitive',
+                                  'Offensive - Deeply disrespectful to users who rely on the model',
+                                  "I'm not familiar with this demonstration"], m)
+    col(77)[current] = multi(rng, ['Binding commitment from OpenAI to permanent availability',
+                                   'Open-source release enabling community-maintained access'], m, k_max=2)
+    storytellers = current[rng.random(m) < 0.4]
+    col(78)[storytellers] = stories(rng, len(storytellers))
+
+    # GPT-5 users
+    col(52)[gpt5] = pick(rng, ['I prefer GPT-5/5.1 series after having used GPT-4o',
+                               'I am a free user and had to switch when GPT-4o became unavailable to free users',
+                               'I only recently started using ChatGPT; GPT-5/5.1 series is the default recommendation and I have not tried 4o'],
+                         len(gpt5), p=[.6, .1, .3])
+
+    # ~1% Japanese-language responses that fail the AQ check (kept by the screening)
+    japanese = current[:max(1, n // 100)]
+    col(42)[japanese] = 'Always'
+    col(78)[japanese] = JAPANESE_STORY
+    return pd.DataFrame(data, columns=cols)
+
+
+def export_dtypes(df):
+    """Answers as strings, wellbeing as numbers - what reading the CSV export back gives."""
+    df = df.copy()
+    for pos, c in enumerate(df.columns):
+        if pos in (38, 39, 40):
+            df[c] = pd.to_numeric(df[c])
+        elif pos > 0:
+            df[c] = df[c].astype('string')
+    return df
+
+
+def write_export(path, rows, seed=0, chunk_rows=10 * REAL_ROWS):
+    """
+    Write `rows` synthetic responses by file suffix: .csv / .parquet (like an export,
+    generated and appended chunk by chunk so memory stays flat) or .xlsx (like the
+    real workbook, in one go). Chunk i is generate(..., seed=(seed, i)), 40 days later
+    than chunk i - 1, so timestamps keep increasing.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix not in ('.csv', '.parquet', '.pq'):
+        generate(rows, seed).to_excel(path, index=False)
+        return path
+
+    writer = None
+    start = pd.Timestamp('2025-11-01')
+    for i, offset in enumerate(range(0, rows, chunk_rows)):
+        chunk = export_dtypes(generate(min(chunk_rows, rows - offset), (seed, i),
+                                       start + pd.Timedelta(days=40 * i)))
+        if suffix == '.csv':
+            chunk.to_csv(path, index=False, header=(i == 0), mode='w' if i == 0 else 'a')
+            continue
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(chunk, preserve_index=False)
+        if writer is None:
+            writer = pq.ParquetWriter(path, table.schema)
+        writer.write_table(table.cast(writer.schema))
+    if writer is not None:
+        writer.close()
+    return path
+
+
+if __name__ == '__main__':
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description='Write a synthetic survey response file.')
+    parser.add_argument('out', help='.xlsx, .csv or .parquet')
+    parser.add_argument('--rows', type=int, default=REAL_ROWS)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    write_export(args.out, args.rows, args.seed)
+    print(f"{args.out}: {args.rows:,} synthetic responses in {time.perf_counter() - start:.1f} s")
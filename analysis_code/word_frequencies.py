@@ -0,0 +1,85 @@
+"""
+Word frequencies for the story word cloud (GRAPH 27).
+
+GRAPH 27 used to join every story into one string, lowercase it, run two
+re.sub passes (punctuation -> space, digits removed) and let WordCloud
+re-tokenize and count the result - several copies of the whole corpus.
+count_words() streams the stories instead: one story at a time is lowercased,
+its digits dropped and its words found with ONE compiled regex, straight into
+a Counter. The tokens are the same words the cleaned text held.
+
+cached_frequencies() keeps the final table (stopwords removed, plurals merged
+into their singular the way WordCloud does) in ONE file, .survey_cache/wordfreq.json,
+next to the hash of the stories and the stopwords it was counted from, so
+unchanged stories are never recounted. A new export overwrites it.
+The table goes to WordCloud.generate_from_frequencies().
+"""
+import hashlib
+import json
+import os
+import re
+from collections import Counter
+from pathlib import Path
+
+from survey_cache import CACHE_DIR_NAME
+
+TOKEN_RE = re.compile(r'\w+')
+DIGITS_RE = re.compile(r'\d+')
+FREQUENCIES_VERSION = 1  # Bump when the tokenizer changes, so old tables aren't reused
+FREQUENCIES_FILE = 'wordfreq.json'
+
+
+def tokenize(story):
+    """Words of one story: lowercase, no digits, split at anything that isn't a word character."""
+    return TOKEN_RE.findall(DIGITS_RE.sub('', story.lower()))
+
+
+def count_words(stories, stopwords=()):
+    """Counter of every word in the stories except the stopwords (one story at a time)."""
+    counts = Counter()
+    for story in stories:
+        counts.update(tokenize(str(story)))
+    for word in set(stopwords) & counts.keys():
+        del counts[word]
+    return counts
+
+
+def merge_plurals(counts):
+    """Fold 'stories'-style plurals into their singular when the singular occurs too (like WordCloud)."""
+    merged = Counter(counts)
+    for word in list(merged):
+        if word.endswith('s') and not word.endswith('ss') and word[:-1] in merged:
+            merged[word[:-1]] += merged.pop(word)
+    return merged
+
+
+def stories_digest(stories, stopwords=()):
+    h = hashlib.sha256(f'v{FREQUENCIES_VERSION}'.encode())
+    h.update('\0'.join(sorted(stopwords)).encode())
+    for story in stories:
+        h.update(b'\x1e' + str(story).encode())
+    return h.hexdigest()
+
+
+def cached_frequencies(stories, stopwords=(), cache_dir=CACHE_DIR_NAME):
+    """
+    {word: count} for the word cloud. Recounted only when the stories (or the
+    stopwords) changed since the table in cache_dir was written.
+    """
+    stories = list(stories)
+    digest = stories_digest(stories, stopwords)
+    path = Path(cache_dir) / FREQUENCIES_FILE
+    try:
+        cached = json.loads(path.read_text(encoding='utf-8'))
+        if cached.get('digest') == digest:
+            return cached['frequencies']
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass  # Missing or unreadable - recount
+    frequencies = dict(merge_plurals(count_words(stories, stopwords)).most_common())
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix('.tmp')
+    tmp.write_text(json.dumps({'digest': digest, 'frequencies': frequencies}, ensure_ascii=False), encoding='utf-8')
+    os.replace(tmp, path)
+    for old in path.parent.glob('wordfreq-*.json'):  # One file per digest, from before
+        old.unlink(missing_ok=True)
+    return frequencies